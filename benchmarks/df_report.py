@@ -0,0 +1,77 @@
+'''
+Benchmark: DF_REPORT column-wise ingestion vs the old row-wise loop
+
+Usage:
+```
+python benchmarks/df_report.py [rows] [columns]
+```
+'''
+import os
+import sys
+import time
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pyreports.xlsx import XLSREPORT, DF_REPORT
+
+
+def make_frame(rows: int, columns: int) -> pd.DataFrame:
+    '''
+    Synthetic DataFrame with mixed dtypes (float with NaN, int, str, datetime)
+    '''
+    rng = np.random.default_rng(0)
+    data = {}
+    for col in range(columns):
+        kind = col % 4
+        if kind == 0:
+            values = rng.random(rows)
+            values[::17] = np.nan
+        elif kind == 1:
+            values = rng.integers(0, 1000, rows)
+        elif kind == 2:
+            values = np.array([f'item_{i % 97}' for i in range(rows)], dtype=object)
+        else:
+            values = pd.date_range('2020-01-01', periods=rows, freq='min')
+        data[f'col_{col}'] = values
+    return pd.DataFrame(data)
+
+def legacy_df_report(path: str, dataFrame: pd.DataFrame) -> None:
+    '''
+    Row-wise ingestion as it was before (iloc per row + list.index per value)
+    '''
+    report = XLSREPORT(path, worksheet_name='Report')
+    headers: list = dataFrame.columns.values.tolist()
+    report.wr_headers(1, 1, headers)
+    report.col_filters()
+    report.low_border(report.row, col_fin=len(headers)+1)
+    report.row_inc()
+    for row in range(len(dataFrame.index)):
+        row_data = list(dataFrame.iloc[row].values)
+        for value in row_data:
+            report.wr(report.row, row_data.index(value)+1, value)
+        report.row_inc()
+    report.col_autofit()
+    report.save()
+    report.close()
+
+def timeit(func, *args, **kwargs) -> float:
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    df = make_frame(rows, columns)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = timeit(legacy_df_report, os.path.join(tmp, 'legacy.xlsx'), df)
+        current = timeit(DF_REPORT, os.path.join(tmp, 'current.xlsx'), df)
+        streaming = timeit(DF_REPORT, os.path.join(tmp, 'streaming.xlsx'), df, write_only=True)
+    print(f'DF_REPORT {rows} rows x {columns} columns')
+    print(f'  legacy row-wise : {legacy:8.2f} s')
+    print(f'  column-wise     : {current:8.2f} s  (x{legacy / current:.1f})')
+    print(f'  column-wise, write_only: {streaming:8.2f} s  (x{legacy / streaming:.1f})')
@@ -0,0 +1,99 @@
+'''
+Benchmark: startup cost of `import pyreports.xlsx` and `import pyreports.pdf`
+
+Every run is a new interpreter with `python -X importtime`, the numbers are the median of the runs:
+- import: cumulative import time of the module (µs, from -X importtime)
+- wall: interpreter start + import, minus an empty interpreter (ms)
+- heavy modules loaded by the import (pandas, numpy, PIL, pypdf) and its slowest direct imports
+
+Usage:
+```
+python benchmarks/import_time.py [--modules pyreports.xlsx pyreports.pdf] [--runs 10] [--output results.json]
+```
+'''
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ('pandas', 'numpy', 'PIL.Image', 'pypdf')
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT + (os.pathsep + env['PYTHONPATH'] if env.get('PYTHONPATH') else '')
+    env.pop('PYTHONDONTWRITEBYTECODE', None) ## Measure the import, not the compilation
+    return env
+
+def importtime(statement: str) -> Tuple[List[Tuple[int, int, str]], float]:
+    '''
+    Lines of `-X importtime` (self µs, cumulative µs, indented name) and wall time (s) of a new interpreter
+    '''
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], env=_env(), capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    lines = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        lines.append((int(self_us), int(cumulative_us), name[1:]))
+    return lines, wall
+
+def measure(module: str, runs: int) -> dict:
+    importtime(f'import {module}') ## Warm up: bytecode cache
+    empty = statistics.median(importtime('pass')[1] for _ in range(runs))
+    totals, walls, children = [], [], {}
+    loaded = set()
+    for _ in range(runs):
+        lines, wall = importtime(f'import {module}')
+        walls.append(wall)
+        index = next(index for index, line in enumerate(lines) if line[2] == module)
+        totals.append(lines[index][1])
+        ## Direct imports of the module: one level deeper, after the previous top level import
+        for self_us, cumulative_us, name in reversed(lines[:index]):
+            if not name.startswith(' '):
+                break
+            if name.startswith('  ') and not name.startswith('   '):
+                children.setdefault(name.strip(), []).append(cumulative_us)
+        loaded.update(name.strip() for _, _, name in lines)
+    slowest = sorted(((statistics.median(values), name) for name, values in children.items()), reverse=True)[:5]
+    return {
+        'module': module,
+        'import_us': statistics.median(totals),
+        'wall_ms': (statistics.median(walls) - empty) * 1000,
+        'heavy': [name for name in HEAVY if name in loaded],
+        'slowest': [{'module': name, 'import_us': value} for value, name in slowest],
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--modules', nargs='+', default=['pyreports.xlsx', 'pyreports.pdf'])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--output', default=None, help='Save the results as JSON')
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'module':<20} {'import (ms)':>12} {'wall (ms)':>10}  heavy modules loaded")
+    for module in args.modules:
+        result = measure(module, args.runs)
+        results.append(result)
+        print(f"{module:<20} {result['import_us'] / 1000:>12.1f} {result['wall_ms']:>10.1f}  {', '.join(result['heavy']) or '-'}")
+        for child in result['slowest']:
+            print(f"    {child['module']:<30} {child['import_us'] / 1000:>8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'runs': args.runs,
+                'results': results,
+            }, file, indent=1)
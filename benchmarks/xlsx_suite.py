@@ -0,0 +1,201 @@
+'''
+Benchmark suite of pyreports.xlsx
+
+Runs offline on synthetic DataFrames (mixed dtypes) and records, for each case and size:
+wall time, cells/sec, peak Python memory (tracemalloc) and output file size.
+
+Usage:
+```
+python benchmarks/xlsx_suite.py run [--sizes 10000 100000 1000000] [--cases ...] [--output results.json]
+python benchmarks/xlsx_suite.py compare baseline.json results.json [--threshold 0.10]
+```
+`compare` exits with code 1 if any case is slower (or uses more memory) than the baseline by more than the threshold.
+'''
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Dict, List
+
+import openpyxl
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from pyreports.xlsx import XLSREPORT, DF_REPORT, get_formula
+from df_report import make_frame
+
+COLUMNS = 10
+IMAGE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'my_img.png')
+
+class bench_columns(Enum):
+    col1 = 1
+    col2 = 2
+    col5 = 5
+
+
+## CASES
+## _________________________________________________________________________________________________________________
+## Every case gets (cells, tmp_dir), does the work and returns the output file (or None)
+## A case can return (path, seconds) to time only a part of the work
+
+def case_df_report(cells: int, tmp: str) -> str:
+    df = make_frame(cells // COLUMNS, COLUMNS)
+    path = os.path.join(tmp, 'df_report.xlsx')
+    t0 = time.perf_counter()
+    DF_REPORT(path, df)
+    return path, time.perf_counter() - t0
+
+def case_df_report_write_only(cells: int, tmp: str) -> str:
+    df = make_frame(cells // COLUMNS, COLUMNS)
+    path = os.path.join(tmp, 'df_report_write_only.xlsx')
+    t0 = time.perf_counter()
+    DF_REPORT(path, df, write_only=True)
+    return path, time.perf_counter() - t0
+
+def _wr_loop(report: XLSREPORT, cells: int) -> None:
+    for row in range(1, cells // COLUMNS + 1):
+        for col in range(1, COLUMNS + 1):
+            report.wr(row, col, row * col if col % 2 else f'text {row}')
+
+def case_wr_loop(cells: int, tmp: str) -> str:
+    path = os.path.join(tmp, 'wr_loop.xlsx')
+    with XLSREPORT(path, 'Data') as report:
+        _wr_loop(report, cells)
+    return path
+
+def case_col_autofit(cells: int, tmp: str) -> str:
+    path = os.path.join(tmp, 'col_autofit.xlsx')
+    report = XLSREPORT(path, 'Data')
+    _wr_loop(report, cells)
+    t0 = time.perf_counter()
+    report.col_autofit()
+    seconds = time.perf_counter() - t0
+    report.close()
+    return path, seconds
+
+def case_get_formula(cells: int, tmp: str) -> None:
+    for row in range(1, cells + 1):
+        get_formula('=IF(<<col2>><<ROW>><0,"Pass",COUNT(<<col1>><<ROW>>:<<col5+3>><<ROW>>))', row, bench_columns)
+
+def case_wr_image(cells: int, tmp: str) -> str:
+    ## One image every 1000 cells, spread over sheets of 10 images
+    path = os.path.join(tmp, 'wr_image.xlsx')
+    with XLSREPORT(path, 'Sheet0') as report:
+        for i in range(max(cells // 1000, 1)):
+            if i and i % 10 == 0:
+                report.sheet_new(f'Sheet{i // 10}')
+            report.wr_image(1 + (i % 10) * 20, 1, IMAGE_PATH, scale=50)
+    return path
+
+CASES: Dict[str, Callable] = {
+    'df_report': case_df_report,
+    'df_report_write_only': case_df_report_write_only,
+    'wr_loop': case_wr_loop,
+    'col_autofit': case_col_autofit,
+    'get_formula': case_get_formula,
+    'wr_image': case_wr_image,
+}
+
+
+## RUNNER
+## _________________________________________________________________________________________________________________
+
+def run_case(func: Callable, cells: int, memory: bool = True) -> dict:
+    '''
+    Run a case once for the time and file size, and once more under tracemalloc for the peak memory
+    '''
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        output = func(cells, tmp)
+        seconds = time.perf_counter() - t0
+        if isinstance(output, tuple):
+            output, seconds = output
+        file_size = os.path.getsize(output) if output else None
+    result = {
+        'cells': cells,
+        'seconds': round(seconds, 6),
+        'cells_per_sec': round(cells / seconds, 1) if seconds else None,
+        'file_bytes': file_size,
+    }
+    if memory:
+        with tempfile.TemporaryDirectory() as tmp:
+            tracemalloc.start()
+            try:
+                func(cells, tmp)
+                result['peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 2**20, 2)
+            finally:
+                tracemalloc.stop()
+    return result
+
+def run(sizes: List[int], cases: List[str], output: str, memory: bool = True) -> dict:
+    report = {
+        'meta': {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'openpyxl': openpyxl.__version__,
+        },
+        'results': {},
+    }
+    for name in cases:
+        for cells in sizes:
+            key = f'{name}@{cells}'
+            report['results'][key] = result = run_case(CASES[name], cells, memory)
+            print(f"{key:32} {result['seconds']:9.3f} s {result['cells_per_sec'] or 0:12.0f} cells/s "
+                  f"{result.get('peak_mb', float('nan')):9.1f} MB {result['file_bytes'] or 0:12d} B", flush=True)
+    with open(output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f'Results: {output}')
+    return report
+
+def compare(baseline: str, current: str, threshold: float = 0.10) -> int:
+    '''
+    Print the relative change of every case and returns the number of regressions above `threshold`
+    '''
+    with open(baseline) as file:
+        base = json.load(file)['results']
+    with open(current) as file:
+        new = json.load(file)['results']
+    regressions = 0
+    for key in sorted(base.keys() & new.keys()):
+        flags = []
+        for metric in ('seconds', 'peak_mb', 'file_bytes'):
+            old_value, new_value = base[key].get(metric), new[key].get(metric)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) / old_value
+            flags.append(f'{metric} {change:+7.1%}')
+            if change > threshold:
+                flags[-1] += ' REGRESSION'
+                regressions += 1
+        print(f'{key:32} ' + ' | '.join(flags))
+    for key in sorted(base.keys() - new.keys()):
+        print(f'{key:32} missing in {current}')
+    print(f'{regressions} regression(s) above {threshold:.0%}')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='Run the suite')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help='Cells per case')
+    run_parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    run_parser.add_argument('--output', default='xlsx_bench.json')
+    run_parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc run')
+    compare_parser = commands.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10)
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        run(args.sizes, args.cases, args.output, memory=not args.no_memory)
+    else:
+        sys.exit(1 if compare(args.baseline, args.current, args.threshold) else 0)
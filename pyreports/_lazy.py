@@ -0,0 +1,29 @@
+'''
+Modules imported on first use, to keep the import of pyreports fast (pandas, numpy, PIL...)
+'''
+import importlib
+from types import ModuleType
+from typing import Any, Dict
+
+
+class LazyModule(ModuleType):
+    '''
+    Placeholder of a module in the globals of another module
+
+    The first attribute read imports the module and puts it in place of the placeholder,
+    so the next reads go straight to the module.
+
+    ```python
+    np = LazyModule('numpy', globals(), 'np')
+    ```
+    '''
+
+    def __init__(self, name: str, namespace: Dict[str, Any], alias: str) -> None:
+        super().__init__(name)
+        self._namespace = namespace
+        self._alias = alias
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        self._namespace[self._alias] = module
+        return getattr(module, attr)
@@ -0,0 +1,211 @@
+'''
+Asyncio entry points: the reports are generated in a thread or process pool, so the event loop is never blocked
+
+- `ReportExecutor`: bounded pool, new jobs wait (backpressure) when `max_workers + max_queue` jobs are in flight
+- `DF_REPORT_async` / `PDF_REPORT_async`: write a report file
+- `DF_REPORT_stream` / `PDF_REPORT_stream`: generate a report in a temporary file and stream its bytes
+
+`Example:`
+```python
+from pyreports.aio import ReportExecutor, DF_REPORT_stream
+
+executor = ReportExecutor(max_workers=4, kind='process')
+
+async def export(request):
+    response = web.StreamResponse()
+    await response.prepare(request)
+    async for chunk in DF_REPORT_stream(get_frame(), executor=executor):
+        await response.write(chunk)
+    return response
+```
+
+***Note:*** Cancelling a task removes its job if it hasn't started yet. A running job can't be interrupted,
+it finishes in the pool (its slot is kept until then) and its output is discarded.
+CPU-heavy reports hold the GIL in a thread pool, use `kind='process'` to keep the latency of the loop.
+'''
+import os
+import asyncio
+import tempfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Optional
+
+import pandas as pd
+
+from .xlsx import DF_REPORT
+from .pdf import PDFREPORT, font_registry
+
+
+## EXECUTOR
+## _________________________________________________________________________________________________________________
+
+class ReportExecutor:
+    '''
+    Pool for report jobs with a bounded queue
+
+    `Args:`
+        - max_workers: int, threads or processes (4)
+        - kind: str, 'thread' | 'process'
+        - max_queue: int, jobs waiting for a worker (16), more jobs wait in `run` until a slot is free
+    '''
+
+    def __init__(self, max_workers: int = 4, kind: str = 'thread', max_queue: int = 16) -> None:
+        if kind not in ('thread', 'process'):
+            raise ValueError(f"kind must be 'thread' or 'process', not {kind!r}")
+        self.max_workers = max_workers
+        self.kind = kind
+        self.max_queue = max_queue
+        self._executor: Executor = None
+        self._slots: asyncio.Semaphore = None
+        self._loop: asyncio.AbstractEventLoop = None
+        self.pending: int = 0 ## jobs in flight (running or waiting for a worker)
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            ## The semaphore belongs to a loop
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_workers + self.max_queue)
+        if self._executor is None:
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='pyreports')
+
+    async def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        '''
+        Send `fn(*args, **kwargs)` to the pool when a slot is free, returns its `concurrent.futures.Future`
+        '''
+        self._start()
+        slots, loop = self._slots, self._loop
+        await slots.acquire()
+        try:
+            future: Future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            slots.release()
+            raise
+        self.pending += 1
+
+        def release() -> None:
+            self.pending -= 1
+            slots.release()
+
+        ## The slot is free when the job ends, not when the caller stops waiting
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(release))
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        '''
+        Run `fn(*args, **kwargs)` in the pool and return its result (`fn` must be picklable for processes)
+        '''
+        return await asyncio.wrap_future(await self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+_default_executor: Optional[ReportExecutor] = None
+
+def default_executor() -> ReportExecutor:
+    '''
+    Executor used when none is given (4 threads), see `set_default_executor`
+    '''
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ReportExecutor()
+    return _default_executor
+
+def set_default_executor(executor: ReportExecutor) -> None:
+    global _default_executor
+    _default_executor = executor
+
+
+## FUNCTIONS
+## _________________________________________________________________________________________________________________
+
+def _build_pdf(path: str, docTitle: str, build: Callable[..., None], args: tuple, report_args: dict) -> None:
+    report = PDFREPORT(path, docTitle, **report_args)
+    build(report, *args)
+    report.save()
+
+def _report_args(report_args: dict, executor: ReportExecutor) -> dict:
+    '''
+    `PDFREPORT` arguments that can be sent to the executor: fonts go to worker processes by family name or font files
+    '''
+    if executor.kind == 'process' and 'fonts' in report_args:
+        report_args = dict(report_args, fonts=font_registry.portable(report_args['fonts']))
+    return report_args
+
+def _read_chunk(path: str, offset: int, size: int) -> bytes:
+    with open(path, 'rb') as file:
+        file.seek(offset)
+        return file.read(size)
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+async def DF_REPORT_async(path: str, dataFrame: pd.DataFrame, write_only: bool = False, executor: ReportExecutor = None) -> None:
+    '''
+    `DF_REPORT` in the executor
+    '''
+    executor = executor if executor else default_executor()
+    await executor.run(DF_REPORT, path, dataFrame, write_only)
+
+async def PDF_REPORT_async(path: str, docTitle: str, build: Callable[..., None], *args: Any, executor: ReportExecutor = None, **report_args: Any) -> None:
+    '''
+    Build and save a `PDFREPORT` in the executor: `build(report, *args)` draws the document
+
+    - `report_args:` pagesize, margins and fonts of `PDFREPORT`
+    '''
+    executor = executor if executor else default_executor()
+    await executor.run(_build_pdf, path, docTitle, build, args, _report_args(report_args, executor))
+
+async def stream_report(write: Callable[..., None], suffix: str, *args: Any, executor: ReportExecutor = None, chunk_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    '''
+    Run `write(path, *args)` in the executor on a temporary file, then yield its bytes in chunks of `chunk_size`
+
+    The file is removed when the stream ends, fails or is cancelled
+    '''
+    executor = executor if executor else default_executor()
+    handle, path = tempfile.mkstemp(prefix='pyreports_', suffix=suffix)
+    os.close(handle)
+    os.remove(path) ## XLSREPORT edits existing files
+    try:
+        future = await executor.submit(write, path, *args)
+    except BaseException:
+        _remove(path)
+        raise
+    try:
+        try:
+            await asyncio.wrap_future(future)
+        except BaseException:
+            ## A running job can't be stopped, its file is removed when it ends
+            future.add_done_callback(lambda _: _remove(path))
+            raise
+        loop = asyncio.get_running_loop()
+        offset = 0
+        while True:
+            ## File reads in the default loop executor, they don't take a report slot
+            chunk = await loop.run_in_executor(None, _read_chunk, path, offset, chunk_size)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+    finally:
+        _remove(path)
+
+def DF_REPORT_stream(dataFrame: pd.DataFrame, write_only: bool = True, executor: ReportExecutor = None, chunk_size: int = 1 << 16) -> AsyncIterator[bytes]:
+    '''
+    Bytes of the .xlsx made by `DF_REPORT`
+    '''
+    return stream_report(DF_REPORT, '.xlsx', dataFrame, write_only, executor=executor, chunk_size=chunk_size)
+
+def PDF_REPORT_stream(docTitle: str, build: Callable[..., None], *args: Any, executor: ReportExecutor = None, chunk_size: int = 1 << 16, **report_args: Any) -> AsyncIterator[bytes]:
+    '''
+    Bytes of the .pdf built by `build(report, *args)` (see `PDF_REPORT_async`)
+    '''
+    executor = executor if executor else default_executor()
+    return stream_report(_build_pdf, '.pdf', docTitle, build, args, _report_args(report_args, executor), executor=executor, chunk_size=chunk_size)
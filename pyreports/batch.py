@@ -0,0 +1,221 @@
+'''
+Toolkit for generating many reports in parallel processes
+
+- .xlsx reports from Pandas DataFrames (`DF_REPORT`)
+- any report (.pdf with `PDFREPORT`, ...) from a picklable build function `build(path, *args)`
+
+`Example:`
+```python
+from pyreports.batch import BatchJob, run_batch
+
+jobs = [BatchJob(path=f'report_{name}.xlsx', data=df) for name, df in frames.items()]
+jobs += [BatchJob(path='summary.pdf', build=build_summary_pdf, args=(title,))]
+for result in run_batch(jobs, max_workers=8):
+    if not result.ok:
+        print(result.path, result.error)
+```
+'''
+import os
+import time
+import pickle
+import traceback
+from concurrent.futures import ProcessPoolExecutor, Future, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .xlsx import DF_REPORT
+
+
+## TOOLS
+## _________________________________________________________________________________________________________________
+
+@dataclass
+class BatchJob:
+    '''
+    Report to generate in a batch
+
+    `Fields:`
+        - path: str, output file
+        - data: pd.DataFrame, for an .xlsx report made with `DF_REPORT`
+        - build: Callable(path, *args), for any other report (must be a module level function)
+        - args: tuple, extra arguments of `build`
+        - write_only: bool, `DF_REPORT` streaming mode
+    '''
+    path: str
+    data: Optional[pd.DataFrame] = None
+    build: Optional[Callable[..., Any]] = None
+    args: tuple = ()
+    write_only: bool = False
+
+@dataclass
+class BatchResult:
+    '''
+    Result of a `BatchJob`
+
+    `Fields:`
+        - index: int, position of the job in the batch
+        - path: str
+        - seconds: float, wall time of the job in the worker
+        - error: str, traceback if the job failed (None)
+    '''
+    index: int
+    path: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+## FUNCTIONS
+## _________________________________________________________________________________________________________________
+
+def _dumps_frame(dataFrame: pd.DataFrame) -> Tuple[str, bytes]:
+    '''
+    Serialize a DataFrame as an Arrow IPC stream (if pyarrow is installed) or pickle protocol 5 buffers
+    '''
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(dataFrame, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            return 'arrow', sink.getvalue().to_pybytes()
+        except (pa.ArrowException, TypeError, ValueError):
+            pass ## Columns Arrow can't represent (mixed objects, ...)
+    return 'pickle', pickle.dumps(dataFrame, protocol=5)
+
+def _loads_frame(kind: str, data: bytes) -> pd.DataFrame:
+    if kind == 'arrow':
+        import pyarrow as pa
+        return pa.ipc.open_stream(data).read_all().to_pandas()
+    return pickle.loads(data)
+
+def _payload(index: int, job: BatchJob) -> tuple:
+    data = _dumps_frame(job.data) if job.data is not None else None
+    return index, job.path, data, job.build, job.args, job.write_only
+
+def _partial_path(path: str) -> str:
+    '''
+    Returns the temporary file of a report, next to it and with the same extension
+    '''
+    folder, name = os.path.split(path)
+    stem, extension = os.path.splitext(name)
+    return os.path.join(folder, f'.{stem}.partial{extension}')
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _run_jobs(payloads: List[tuple]) -> List[BatchResult]:
+    '''
+    Worker: run a chunk of jobs, errors are returned with the result of each job
+
+    Every report is written to a temporary file that replaces `path` once it is complete,
+    so a failed or killed job never leaves a partial report
+    '''
+    results = []
+    for index, path, data, build, args, write_only in payloads:
+        t0 = time.perf_counter()
+        error = None
+        if data is not None and not os.path.splitext(path)[1]:
+            path += '.xlsx' ## As XLSREPORT does
+        partial = _partial_path(path)
+        try:
+            _remove(partial) ## Left by a worker that died
+            if build is not None:
+                build(partial, *args)
+            elif data is not None:
+                DF_REPORT(partial, _loads_frame(*data), write_only=write_only)
+            else:
+                raise ValueError("BatchJob without data or build function")
+            if not os.path.exists(partial):
+                raise FileNotFoundError(f"The build function didn't write the file: {partial}")
+            os.replace(partial, path)
+        except Exception:
+            error = traceback.format_exc()
+            _remove(partial)
+        results.append(BatchResult(index, path, time.perf_counter() - t0, error))
+    return results
+
+def run_batch(jobs: Iterable[BatchJob], max_workers: int = None, chunk_size: int = 1, max_pending: int = None) -> List[BatchResult]:
+    '''
+    Generate the reports of `jobs` in a process pool
+
+    `Args:`
+        - jobs: Iterable[BatchJob], consumed lazily
+        - max_workers: int, processes (os.cpu_count() by default)
+        - chunk_size: int, jobs sent to a worker at once (1), increase it for many small reports
+        - max_pending: int, chunks in flight (2 * max_workers by default), bounds the serialized data in memory
+
+    `Returns:`
+        - List[BatchResult] in the order of `jobs`. A failed job doesn't stop the batch.
+
+    ***Note:*** If a worker process dies, the jobs that were in flight are retried once, alone, in a new pool.
+    Reports are written to a temporary `.<name>.partial<ext>` file in the same folder and moved to `path` when complete.
+    '''
+    max_workers = max_workers if max_workers else (os.cpu_count() or 1)
+    max_pending = max_pending if max_pending else 2 * max_workers
+    results: Dict[int, BatchResult] = {}
+    pending: Dict[Future, Tuple[List[Tuple[int, BatchJob]], bool]] = {}
+    retries: List[List[Tuple[int, BatchJob]]] = []
+    queue = enumerate(jobs)
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            ## SUBMIT
+            while True:
+                retry = bool(retries)
+                if retry:
+                    ## Retried jobs run alone, so a crashing job can't take others with it
+                    if pending:
+                        break
+                    chunk = retries.pop(0)
+                elif len(pending) < max_pending:
+                    chunk = list(islice(queue, chunk_size))
+                else:
+                    break
+                if not chunk:
+                    break
+                payloads = [_payload(index, job) for index, job in chunk]
+                pending[executor.submit(_run_jobs, payloads)] = (chunk, retry)
+            if not pending:
+                break
+
+            ## COLLECT
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                chunk, retried = pending.pop(future)
+                try:
+                    for result in future.result():
+                        results[result.index] = result
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        broken = True
+                        if not retried:
+                            retries.extend([job] for job in chunk)
+                            continue
+                    error = ''.join(traceback.format_exception_only(type(e), e))
+                    for index, job in chunk:
+                        results[index] = BatchResult(index, job.path, error=error)
+            if broken:
+                ## A worker died and the pool can't be used anymore
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+    finally:
+        executor.shutdown(wait=True)
+
+    return [results[index] for index in sorted(results)]
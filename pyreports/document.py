@@ -0,0 +1,385 @@
+'''
+Format-neutral report document, built once and rendered to .xlsx (`XLSREPORT`) and .pdf (`PDFREPORT`)
+
+Blocks: title, header, paragraph, table, image and divider.
+Table sources are read lazily (DataFrame, iterator of DataFrames or a function returning one),
+and every chunk is read once and shared by all the renderers.
+
+`Example:`
+```python
+from pyreports.document import Document, XLSXRenderer, PDFRenderer, render
+
+doc = Document('Sales 2024')
+doc.add_title('Sales 2024').add_paragraph('Monthly sales by shop')
+doc.add_table(lambda: pd.read_csv('sales.csv', chunksize=10000))
+render(doc, [XLSXRenderer('sales.xlsx'), PDFRenderer('sales.pdf')])
+```
+'''
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from .xlsx import XLSREPORT, fonts, df_col_fit, df_rows
+from .pdf import PDFREPORT, Font
+
+
+## BLOCKS
+## _________________________________________________________________________________________________________________
+
+@dataclass
+class Title:
+    text: str
+
+@dataclass
+class Header:
+    text: str
+    level: int = 1
+
+@dataclass
+class Paragraph:
+    text: str
+
+@dataclass
+class Table:
+    '''
+    `source:` DataFrame, iterator of DataFrames (read once) or a function returning DataFrames (read once per render)
+    '''
+    source: Union[pd.DataFrame, Iterable[pd.DataFrame], Callable[[], Iterable[pd.DataFrame]]]
+
+@dataclass
+class Image:
+    path: str
+    size_percent: float = 100.0
+
+@dataclass
+class Divider:
+    pass
+
+Block = Union[Title, Header, Paragraph, Table, Image, Divider]
+
+@dataclass
+class Document:
+    '''
+    Report content, independent of the output format
+
+    The `add_*` methods return the document, so they can be chained
+    '''
+    title: str = None
+    blocks: List[Block] = field(default_factory=list)
+
+    def add_title(self, text: str) -> 'Document':
+        self.blocks.append(Title(text))
+        return self
+
+    def add_header(self, text: str, level: int = 1) -> 'Document':
+        self.blocks.append(Header(text, level))
+        return self
+
+    def add_paragraph(self, text: str) -> 'Document':
+        self.blocks.append(Paragraph(text))
+        return self
+
+    def add_table(self, source: Union[pd.DataFrame, Iterable[pd.DataFrame], Callable[[], Iterable[pd.DataFrame]]]) -> 'Document':
+        self.blocks.append(Table(source))
+        return self
+
+    def add_image(self, path: str, size_percent: float = 100.0) -> 'Document':
+        self.blocks.append(Image(path, size_percent))
+        return self
+
+    def add_divider(self) -> 'Document':
+        self.blocks.append(Divider())
+        return self
+
+
+## FUNCTIONS
+## _________________________________________________________________________________________________________________
+
+def table_chunks(source: Any) -> Iterator[pd.DataFrame]:
+    '''
+    DataFrames of a table source
+    '''
+    if callable(source):
+        source = source()
+    if isinstance(source, pd.DataFrame):
+        yield source
+    else:
+        yield from source
+
+def _is_one_shot(source: Any) -> bool:
+    return not callable(source) and not isinstance(source, pd.DataFrame) and iter(source) is source
+
+def _items(document: Document) -> Iterator[Tuple[Block, Optional[Iterator[pd.DataFrame]]]]:
+    for block in document.blocks:
+        yield block, table_chunks(block.source) if isinstance(block, Table) else None
+
+
+## RENDERERS
+## _________________________________________________________________________________________________________________
+
+class Renderer:
+    '''
+    Output format of a `Document`: a method for every block, named as the block in lower case
+
+    `render` receives (block, chunks) pairs, `chunks` is the iterator of DataFrames of a `Table` block (None for the rest).
+    The chunks of a table must be read before the next block.
+    '''
+
+    def render(self, document: Document, items: Iterable[Tuple[Block, Optional[Iterator[pd.DataFrame]]]]) -> None:
+        self.begin(document)
+        for block, chunks in items:
+            if chunks is None:
+                getattr(self, type(block).__name__.lower())(block)
+            else:
+                self.table(block, chunks)
+        self.end()
+
+    def begin(self, document: Document) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+class XLSXRenderer(Renderer):
+    '''
+    `Document` to an .xlsx worksheet, blocks are written one below the other from column A
+
+    In `write_only` mode the blocks before the first table are kept until its first chunk,
+    so the column widths can be set before any row is written.
+    '''
+
+    def __init__(self, path: str, worksheet_name: str = 'Report', write_only: bool = False) -> None:
+        self.path = path
+        self.worksheet_name = worksheet_name
+        self.write_only = write_only
+
+    def begin(self, document: Document) -> None:
+        self.report = XLSREPORT(self.path, self.worksheet_name, write_only=self.write_only)
+        self.columns = 1
+        self._pending: List[Callable[[], None]] = []
+        self._widths_set = not self.write_only
+
+    def _write(self, write: Callable[[], None]) -> None:
+        if self._widths_set:
+            write()
+        else:
+            self._pending.append(write)
+
+    def _set_widths(self) -> None:
+        if not self._widths_set:
+            self.report.col_autofit()
+            self._widths_set = True
+            for write in self._pending:
+                write()
+            self._pending = []
+
+    def title(self, block: Title) -> None:
+        def write():
+            report = self.report
+            report.wr(report.row, 1, block.text, font=fonts.title.value, fit=False)
+            report.row_height(report.row, 30)
+            report.row_inc(2)
+        self._write(write)
+
+    def header(self, block: Header) -> None:
+        def write():
+            report = self.report
+            report.wr(report.row, 1, block.text, font=fonts.header.value, fit=False)
+            report.row_inc()
+        self._write(write)
+
+    def paragraph(self, block: Paragraph) -> None:
+        def write():
+            report = self.report
+            report.wr(report.row, 1, block.text, fit=False)
+            report.row_inc()
+        self._write(write)
+
+    def image(self, block: Image) -> None:
+        def write():
+            report = self.report
+            report.row, _ = report.wr_image(report.row, 1, block.path, block.size_percent)
+        self._write(write)
+
+    def divider(self, block: Divider) -> None:
+        def write():
+            report = self.report
+            report.low_border(report.row, 1, self.columns + 1)
+            report.row_inc()
+        self._write(write)
+
+    def table(self, block: Table, chunks: Iterator[pd.DataFrame]) -> None:
+        report = self.report
+        headers = None
+        for chunk in chunks:
+            if headers is None:
+                headers = [str(column) for column in chunk.columns]
+                self.columns = max(self.columns, len(headers))
+                for col, header in enumerate(headers, start=1):
+                    report.col_fit(col, header, fonts.header.value)
+                df_col_fit(report, chunk)
+                self._set_widths()
+                report.wr_headers(report.row, 1, headers)
+                report.low_border(report.row, 1, len(headers) + 1)
+                report.row_inc()
+            elif not self.write_only:
+                df_col_fit(report, chunk)
+            report.row = report.wr_rows(report.row, 1, df_rows(chunk), fit=False)
+        if headers is not None:
+            report.row_inc()
+
+    def end(self) -> None:
+        self._set_widths()
+        if not self.write_only:
+            self.report.col_autofit()
+        self.report.close()
+
+class PDFRenderer(Renderer):
+    '''
+    `Document` to a .pdf with the flow layout of `PDFREPORT` (new pages are started when needed)
+
+    - `font_size:` Size of the paragraphs (10), tables use a point less
+    - `report_args:` pagesize, margins and fonts of `PDFREPORT`
+    '''
+
+    def __init__(self, path: str, docTitle: str = None, font_size: float = 10, **report_args) -> None:
+        self.path = path
+        self.docTitle = docTitle
+        self.font_size = font_size
+        self.report_args = report_args
+
+    def begin(self, document: Document) -> None:
+        self.report = PDFREPORT(self.path, self.docTitle if self.docTitle else document.title, **self.report_args)
+
+    def title(self, block: Title) -> None:
+        self.report.add_paragraph(block.text, Font.fields.bold, 18)
+        self.report.add_space(self.report.spacing)
+
+    def header(self, block: Header) -> None:
+        if block.level <= 1:
+            self.report.add_header1(block.text)
+        else:
+            self.report.add_paragraph(block.text, Font.fields.bold, max(14 - block.level, self.font_size))
+
+    def paragraph(self, block: Paragraph) -> None:
+        self.report.add_paragraph(block.text, font_size=self.font_size)
+        self.report.add_space(self.report.spacing)
+
+    def image(self, block: Image) -> None:
+        self.report.add_image(block.path, block.size_percent)
+
+    def divider(self, block: Divider) -> None:
+        self.report.add_divider(1)
+
+    def table(self, block: Table, chunks: Iterator[pd.DataFrame]) -> None:
+        self.report.add_table(chunks, font_size=self.font_size - 1)
+        self.report.add_space(self.report.spacing)
+
+    def end(self) -> None:
+        self.report.save()
+
+
+## RENDER
+## _________________________________________________________________________________________________________________
+
+_END = object()
+_END_TABLE = object()
+
+class _QueueItems:
+    '''
+    (block, chunks) pairs of a renderer thread, read from its queue
+    '''
+
+    def __init__(self, items: queue.Queue) -> None:
+        self.items = items
+        self.table_open = False
+        self.ended = False
+
+    def __iter__(self):
+        while not self.ended:
+            ## Chunks of a table that the renderer didn't read
+            while self.table_open:
+                for _ in self.chunks():
+                    pass
+            item = self.items.get()
+            if item is _END:
+                self.ended = True
+                return
+            if isinstance(item, Table):
+                self.table_open = True
+                yield item, self.chunks()
+            else:
+                yield item, None
+
+    def chunks(self) -> Iterator[pd.DataFrame]:
+        while self.table_open:
+            item = self.items.get()
+            if item is _END_TABLE:
+                self.table_open = False
+            elif item is _END:
+                self.table_open, self.ended = False, True
+            else:
+                yield item
+
+    def drain(self) -> None:
+        while not self.ended:
+            if self.items.get() is _END:
+                self.ended = True
+
+def render(document: Document, renderers: List[Renderer], concurrent: bool = True, queue_size: int = 4) -> None:
+    '''
+    Render a document with every renderer, reading every table source once
+
+    `Args:`
+        - renderers: List[Renderer], ex: [XLSXRenderer('report.xlsx'), PDFRenderer('report.pdf')]
+        - concurrent: bool, run the renderers at the same time in threads (True). One after the other needs
+        table sources that can be read again (DataFrame or function), iterators can be read only once.
+        - queue_size: int, blocks and chunks waiting for the slowest renderer (4), bounds the memory
+
+    ***Note:*** The first error of a renderer is raised when all of them have finished
+    '''
+    if len(renderers) <= 1 or not concurrent:
+        if len(renderers) > 1 and any(_is_one_shot(block.source) for block in document.blocks if isinstance(block, Table)):
+            raise ValueError("Table iterators can be read only once, use concurrent=True or a function returning the iterator")
+        for renderer in renderers:
+            renderer.render(document, _items(document))
+        return
+
+    queues = [queue.Queue(maxsize=queue_size) for _ in renderers]
+    errors: List[BaseException] = [None] * len(renderers)
+
+    def work(index: int) -> None:
+        items = _QueueItems(queues[index])
+        try:
+            renderers[index].render(document, items)
+        except BaseException as e:
+            errors[index] = e
+        finally:
+            ## The producer never waits for a renderer that stopped
+            items.drain()
+
+    threads = [threading.Thread(target=work, args=(index,), daemon=True) for index in range(len(renderers))]
+    for thread in threads:
+        thread.start()
+
+    def put(item: Any) -> None:
+        for items in queues:
+            items.put(item)
+
+    try:
+        for block in document.blocks:
+            put(block)
+            if isinstance(block, Table):
+                for chunk in table_chunks(block.source):
+                    put(chunk)
+                put(_END_TABLE)
+    finally:
+        put(_END)
+        for thread in threads:
+            thread.join()
+    for error in errors:
+        if error is not None:
+            raise error
@@ -0,0 +1,147 @@
+'''
+Opt-in counters and timers of the reports, disabled by default
+
+Every instrumented point checks `metrics.enabled` first, so nothing is measured (or allocated) until a hook is added.
+
+`Events:`
+    - xlsx.cells: cells written by `XLSREPORT.wr`, `wr_rows` and `wr_formulas` (count)
+    - xlsx.styles: workbook styles created by `XLSREPORT` (count)
+    - xlsx.col_autofit: `XLSREPORT.col_autofit` (time)
+    - xlsx.save / xlsx.save.bytes: `XLSREPORT.save` serialization (time) and size of the file (count)
+    - xlsx.image_decode: images read by `XLSREPORT.wr_image` (time)
+    - pdf.pages: pages emitted by `PDFREPORT.save` (count)
+    - pdf.save / pdf.save.bytes: `PDFREPORT.save` serialization (time) and size of the file (count)
+    - pdf.image_decode: images read by `PDFREPORT.wr_image` (time)
+    - pdf.fonts: font lookup, parsing and registration of a `PDFREPORT` (time)
+
+Times are in seconds.
+
+`Example:`
+```python
+from pyreports import metrics
+
+with metrics.collect() as summary:
+    DF_REPORT('my_report.xlsx', df)
+print(summary)
+summary.reports['my_report.xlsx']['xlsx.save']
+
+metrics.add_hook(lambda event: print(event.name, event.value)) ## every event, from any thread
+```
+'''
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List
+
+
+## EVENTS
+## _________________________________________________________________________________________________________________
+
+enabled: bool = False ## True while there are hooks
+
+_hooks: List[Callable[['Event'], None]] = []
+_lock = threading.Lock()
+
+@dataclass
+class Event:
+    '''
+    `Fields:`
+        - name: str, ex: 'xlsx.save'
+        - value: float, seconds for timers
+        - kind: str, 'count' | 'time'
+        - report: XLSREPORT | PDFREPORT | None
+    '''
+    name: str
+    value: float
+    kind: str = 'count'
+    report: Any = None
+
+def add_hook(hook: Callable[[Event], None]) -> None:
+    '''
+    Call `hook(event)` on every event, measuring starts with the first hook
+    '''
+    global enabled
+    with _lock:
+        _hooks.append(hook)
+        enabled = True
+
+def remove_hook(hook: Callable[[Event], None]) -> None:
+    global enabled
+    with _lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+        enabled = bool(_hooks)
+
+def emit(name: str, value: float, kind: str = 'count', report: Any = None) -> None:
+    '''
+    Send an event to the hooks (callers check `enabled` first)
+    '''
+    event = Event(name, value, kind, report)
+    for hook in tuple(_hooks):
+        hook(event)
+
+@contextmanager
+def timer(name: str, report: Any = None) -> Iterator[None]:
+    '''
+    Time the `with` block as the event `name` (nothing is done if disabled)
+    '''
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        emit(name, time.perf_counter() - start, 'time', report)
+
+
+## SUMMARY
+## _________________________________________________________________________________________________________________
+
+def report_label(report: Any) -> str:
+    '''
+    File path of a report ('' for events without report)
+    '''
+    if report is None:
+        return ''
+    path = getattr(report, 'filePath', None)
+    if path is None:
+        path = getattr(getattr(report, 'PDF', None), '_filename', None)
+    return path if isinstance(path, str) else f'{type(report).__name__} {id(report):#x}'
+
+class Summary:
+    '''
+    Hook that adds up the events: `totals` and `reports` (by report path), name -> value
+    '''
+
+    def __init__(self) -> None:
+        self.totals: Dict[str, float] = {}
+        self.reports: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Event) -> None:
+        with self._lock:
+            self.totals[event.name] = self.totals.get(event.name, 0) + event.value
+            values = self.reports.setdefault(report_label(event.report), {})
+            values[event.name] = values.get(event.name, 0) + event.value
+
+    def __repr__(self) -> str:
+        lines = []
+        for label, values in self.reports.items():
+            lines.append(label if label else '(no report)')
+            for name, value in sorted(values.items()):
+                lines.append(f'    {name:<20} {value:.6f}' if isinstance(value, float) else f'    {name:<20} {value}')
+        return '\n'.join(lines)
+
+@contextmanager
+def collect() -> Iterator[Summary]:
+    '''
+    Measure the reports made inside the `with` block, returns their `Summary`
+    '''
+    summary = Summary()
+    add_hook(summary)
+    try:
+        yield summary
+    finally:
+        remove_hook(summary)
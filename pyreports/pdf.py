@@ -35,19 +35,37 @@ NOTES:
 	```
 
 '''
+import io
 import os
+import re
+import copy
+import json
+import math
+import itertools
+import shutil
+import tempfile
+import weakref
+import zlib
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
-from PIL import Image
-from io import BytesIO
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
 
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import cm, inch
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase import pdfmetrics, pdfdoc
 from reportlab.lib import pagesizes
 from reportlab.lib import colors
-from reportlab.lib.utils import ImageReader
+from reportlab.lib.utils import asBytes
+
+from . import metrics
+from ._lazy import LazyModule
+
+## Imported on first use (charts and images), pypdf and the process pool only in `render_parallel`
+np = LazyModule('numpy', globals(), 'np')
+Image = LazyModule('PIL.Image', globals(), 'Image')
 
 ## TOOLS
 ## _________________________________________________________________________________________________________________
@@ -80,17 +98,540 @@ class Font:
 		size: float = 12
 		color: colors = colors.black
 
-arial_fonts = Font.types(
-	normal = TTFont('normal', 'arial.ttf'),
-	bold = TTFont('bold', 'arialbd.ttf'),
-	italic = TTFont('italic', 'ariali.ttf'),
-	italic_bold = TTFont('italic_bold', 'arialbi.ttf')
-)
+class FontRegistry:
+	'''
+	Process-wide registry of the report fonts
+
+	Font files are found on first use in `search_paths` (`PYREPORTS_FONT_PATH` environment variable first),
+	every TTF file is parsed once per process and registered once in reportlab.
+	The index of the font files in the folders is cached on disk (`cache_path`) and used while no folder changed
+	(same modification times), so the font folders are scanned only once, also for the files that are not found.
+	Parsed fonts can't be pickled, so each process still parses the TTF files it uses.
+	TrueType fonts are always embedded as subsets (only the used glyphs).
+
+	Families are tried in `fallback` order, then the built-in Helvetica is used.
+
+	```python
+	from pyreports.pdf import font_registry
+	font_registry.search_paths.insert(0, '/opt/fonts')
+	fonts = font_registry.types('arial')
+	```
+	'''
+	families: Dict[str, Dict[str, Tuple[str, ...]]] = {
+		'arial': {
+			'normal': ('arial.ttf',),
+			'bold': ('arialbd.ttf', 'arial bold.ttf'),
+			'italic': ('ariali.ttf', 'arial italic.ttf'),
+			'italic_bold': ('arialbi.ttf', 'arial bold italic.ttf'),
+		},
+		'liberation_sans': { ## Same metrics as Arial
+			'normal': ('LiberationSans-Regular.ttf',),
+			'bold': ('LiberationSans-Bold.ttf',),
+			'italic': ('LiberationSans-Italic.ttf',),
+			'italic_bold': ('LiberationSans-BoldItalic.ttf',),
+		},
+		'dejavu_sans': {
+			'normal': ('DejaVuSans.ttf',),
+			'bold': ('DejaVuSans-Bold.ttf',),
+			'italic': ('DejaVuSans-Oblique.ttf',),
+			'italic_bold': ('DejaVuSans-BoldOblique.ttf',),
+		},
+	}
+	fallback: Tuple[str, ...] = ('arial', 'liberation_sans', 'dejavu_sans')
+	builtin: Dict[str, str] = {
+		'normal': 'Helvetica',
+		'bold': 'Helvetica-Bold',
+		'italic': 'Helvetica-Oblique',
+		'italic_bold': 'Helvetica-BoldOblique',
+	}
+
+	def __init__(self) -> None:
+		self.search_paths: List[str] = [path for path in os.environ.get('PYREPORTS_FONT_PATH', '').split(os.pathsep) if path] + [
+			os.getcwd(),
+			os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+			os.path.expanduser(r'~\AppData\Local\Microsoft\Windows\Fonts'),
+			'/Library/Fonts',
+			os.path.expanduser('~/Library/Fonts'),
+			'/usr/share/fonts',
+			'/usr/local/share/fonts',
+			os.path.expanduser('~/.fonts'),
+			os.path.expanduser('~/.local/share/fonts'),
+		]
+		self.cache_path: str = os.environ.get('PYREPORTS_FONT_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'pyreports', 'fonts.json'))
+		self._index: Dict[str, str] = None ## file name (lower case) -> path, from the disk cache or scanning the search paths
+		self._types: Dict[Any, Font.types] = {} ## family name (or font files) -> fonts
+		self._registered: Dict[str, object] = {}
+
+	def _roots(self) -> List[str]:
+		## The working folder is only searched directly
+		cwd = os.getcwd()
+		return [folder for folder in dict.fromkeys(os.path.abspath(path) for path in self.search_paths) if folder != cwd]
+
+	@staticmethod
+	def _mtime(folder: str) -> float:
+		try:
+			return os.stat(folder).st_mtime
+		except OSError:
+			return None
+
+	def _load_cache(self, roots: List[str]) -> Dict[str, str]:
+		'''
+		Returns the file index of the disk cache, None if it is missing or any folder changed since it was made
+		'''
+		try:
+			with open(self.cache_path, encoding='utf-8') as file:
+				cache = json.load(file)
+			folders, index = cache['folders'], cache['index']
+			if cache['roots'] != roots or not isinstance(folders, dict) or not isinstance(index, dict):
+				return None
+		except (OSError, ValueError, TypeError, KeyError):
+			return None
+		for folder, mtime in folders.items():
+			if self._mtime(folder) != mtime:
+				return None
+		return index
+
+	def _save_cache(self, roots: List[str], folders: Dict[str, float], index: Dict[str, str]) -> None:
+		try:
+			os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+			tmp_path = self.cache_path + f'.{os.getpid()}.tmp'
+			with open(tmp_path, 'w', encoding='utf-8') as file:
+				json.dump({'roots': roots, 'folders': folders, 'index': index}, file, indent=1)
+			os.replace(tmp_path, self.cache_path)
+		except OSError:
+			pass ## Read-only home, the folders are scanned again in the next run
+
+	def _scan(self) -> Dict[str, str]:
+		'''
+		Returns the index of the font files (lower case name -> path), from the disk cache while no folder changed
+		'''
+		roots = self._roots()
+		index = self._load_cache(roots)
+		if index is not None:
+			return index
+		index, folders = {}, {}
+		for folder in roots:
+			folders[folder] = self._mtime(folder)
+			if not os.path.isdir(folder):
+				continue
+			for root, _, files in os.walk(folder):
+				folders[root] = self._mtime(root)
+				for file in files:
+					if file.lower().endswith(('.ttf', '.ttc')):
+						index.setdefault(file.lower(), os.path.join(root, file))
+		self._save_cache(roots, folders, index)
+		return index
+
+	def find(self, file_names: Tuple[str, ...]) -> str:
+		'''
+		Returns the path of the first font file found (None if not found)
+		'''
+		for name in file_names:
+			for folder in self.search_paths:
+				path = os.path.join(folder, name)
+				if os.path.isfile(path):
+					return path
+		if self._index is None:
+			self._index = self._scan()
+		for name in file_names:
+			path = self._index.get(name.lower())
+			if path and os.path.isfile(path):
+				return path
+		return None
+
+	def types(self, family: str = None) -> Font.types:
+		'''
+		Returns the fonts of a family (first family of `fallback` found by default), parsed once per process
+
+		Raises FileNotFoundError if a selected family is not found
+		'''
+		key = family if family else ''
+		if key in self._types:
+			return self._types[key]
+		for name in ((family,) if family else self.fallback):
+			if name in self._types:
+				fonts = self._types[name]
+				break
+			paths = {style: self.find(files) for style, files in self.families[name].items()}
+			if all(paths.values()):
+				fonts = self._types[name] = Font.types(**{style: TTFont(style, path) for style, path in paths.items()})
+				break
+		else:
+			if family:
+				raise FileNotFoundError(f"Font family '{family}' not found in {self.search_paths}")
+			fonts = Font.types(**{style: pdfmetrics.Font(style, face, 'WinAnsiEncoding') for style, face in self.builtin.items()})
+		self._types[key] = fonts
+		return fonts
+
+	def resolve(self, fonts: 'Font.types | str | Dict[str, str]' = None) -> Font.types:
+		'''
+		Returns the fonts of a report from a `Font.types`, a family name, or the description made by `portable`
+		'''
+		if fonts is None or isinstance(fonts, str):
+			return self.types(fonts)
+		if not isinstance(fonts, dict):
+			return fonts
+		key = tuple(sorted(fonts.items()))
+		if key not in self._types:
+			self._types[key] = Font.types(**{
+				style: pdfmetrics.Font(style, source[len('builtin:'):], 'WinAnsiEncoding') if source.startswith('builtin:') else TTFont(style, source)
+				for style, source in fonts.items()
+			})
+		return self._types[key]
+
+	def portable(self, fonts: 'Font.types | str | Dict[str, str]' = None) -> 'str | Dict[str, str]':
+		'''
+		Returns a description of the fonts that can be sent to other processes (TTFont objects can't be pickled):
+		the family name if they are a family of the registry, otherwise the font file (or built-in face) of each style.
+		`resolve` turns it back into fonts, parsed once per process.
+		'''
+		if fonts is None or isinstance(fonts, (str, dict)):
+			return fonts
+		for family, types in self._types.items():
+			if types is fonts and isinstance(family, str):
+				return family if family else None
+		sources = {}
+		for style in Font.fields:
+			font = getattr(fonts, style.value)
+			filename = getattr(getattr(font, 'face', None), 'filename', None)
+			if isinstance(font, TTFont) and filename:
+				sources[style.value] = filename
+			elif not isinstance(font, TTFont) and font.face.name in pdfmetrics.standardFonts:
+				sources[style.value] = 'builtin:' + font.face.name
+			else:
+				raise ValueError(f"Font {font.fontName!r} can't be sent to other processes, use a family of font_registry or TTF files")
+		return sources
+
+	def register(self, fonts: Font.types) -> None:
+		'''
+		Register the fonts in reportlab, fonts already registered are skipped
+		'''
+		for font in (fonts.normal, fonts.bold, fonts.italic, fonts.italic_bold):
+			if self._registered.get(font.fontName) is not font:
+				pdfmetrics.registerFont(font)
+				self._registered[font.fontName] = font
+
+font_registry = FontRegistry()
+
+def __getattr__(name: str):
+	## Arial fonts are parsed only if they are used, the fallback family is returned if Arial is not installed
+	if name == 'arial_fonts':
+		try:
+			return font_registry.types('arial')
+		except FileNotFoundError:
+			return font_registry.types()
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class GlyphWidths:
+	'''
+	Advance widths of the characters of a registered font, measured once per character and cached per font object
+
+	Widths are stored for a size of 1 pt, the width at any size is a single multiplication.
+
+	```python
+	widths = GlyphWidths.of('normal')
+	widths.width('Hello world', 12)
+	```
+	'''
+	_cache = weakref.WeakKeyDictionary()
+	_max_words = 50000
+
+	def __init__(self, font_name: str):
+		self.font_name = font_name
+		self.chars: Dict[str, float] = {}
+		self.words: Dict[str, float] = {}
+
+	@classmethod
+	def of(cls, font_name: str) -> 'GlyphWidths':
+		'''
+		Returns the widths table of a registered font
+		'''
+		try:
+			font = pdfmetrics.getFont(font_name)
+		except KeyError:
+			## Report fonts used before any PDFREPORT
+			font_registry.register(font_registry.types())
+			font = pdfmetrics.getFont(font_name)
+		widths = cls._cache.get(font)
+		if widths is None:
+			widths = cls._cache[font] = cls(font_name)
+		return widths
+
+	def width(self, text: str, font_size: float = 1) -> float:
+		chars = self.chars
+		total = 0.0
+		for char in text:
+			advance = chars.get(char)
+			if advance is None:
+				advance = chars[char] = pdfmetrics.stringWidth(char, self.font_name, 1)
+			total += advance
+		return total * font_size
+
+	def word_width(self, word: str, font_size: float = 1) -> float:
+		'''
+		Width of a word, cached (words repeat a lot in free text)
+		'''
+		advance = self.words.get(word)
+		if advance is None:
+			if len(self.words) >= self._max_words:
+				self.words.clear()
+			advance = self.words[word] = self.width(word)
+		return advance * font_size
+
+@dataclass
+class _PDFImage:
+	'''
+	Image file to draw: `source` is the file given to reportlab (registered once per document as an XObject)
+	'''
+	source: str
+	width: float ## points, at 100%
+	height: float
+
+@dataclass
+class TextStyle:
+	'''
+	Style of a run of text (see `PDFREPORT.write_runs`)
+	'''
+	font_name: 'Font.fields | str' = Font.fields.normal
+	font_size: float = 12
+	color: colors = colors.black
+
+@dataclass
+class TemplateSlot:
+	'''
+	Variable text of a page template, drawn on every page
+
+	`Fields:`
+		- x, y: float, position of the text (`x` is the left, center or right of the text, see `align`)
+		- text: str, format string with the fields `page`, `title`, `date` (datetime) and the `template_values` of the report,
+		ex: 'Page {page}', '{date:%d/%m/%Y}'
+		- font_name: Font.fields | str
+		- font_size: float
+		- color: colors
+		- align: str, 'left' | 'center' | 'right'
+	'''
+	x: float
+	y: float
+	text: str
+	font_name: 'Font.fields | str' = Font.fields.normal
+	font_size: float = 8
+	color: colors = colors.black
+	align: str = 'left'
+
+def _table_cells(dataFrame, float_format: str) -> List[List[str]]:
+	'''
+	Columns of a DataFrame as lists of texts (NaN / None -> '')
+	'''
+	columns = []
+	for i in range(dataFrame.shape[1]):
+		series = dataFrame.iloc[:, i]
+		empty = series.isna().to_numpy()
+		if series.dtype.kind == 'f':
+			texts = [float_format.format(value) for value in series.tolist()]
+		else:
+			texts = [str(value) for value in series.tolist()]
+		if empty.any():
+			texts = ['' if is_empty else text for text, is_empty in zip(texts, empty.tolist())]
+		columns.append(texts)
+	return columns
+
+def _fit_widths(widths: List[float], available: float) -> List[float]:
+	'''
+	Narrow the widest columns (to the same width) until the sum of widths is `available`
+	'''
+	if sum(widths) <= available:
+		return list(widths)
+	result = list(widths)
+	order = sorted(range(len(widths)), key=lambda i: widths[i])
+	remaining = available
+	for k, i in enumerate(order):
+		share = remaining / (len(order) - k)
+		if widths[i] > share:
+			for j in order[k:]:
+				result[j] = share
+			break
+		remaining -= widths[i]
+	return result
+
+def _cut_text(text: str, widths: 'GlyphWidths', font_size: float, max_width: float) -> Tuple[str, float]:
+	'''
+	Returns the text (cut with "..." if it is wider than `max_width`) and its width
+	'''
+	width = widths.width(text, font_size)
+	if width <= max_width:
+		return text, width
+	dots = widths.width('...', font_size)
+	width = 0.0
+	for end, char in enumerate(text):
+		advance = widths.width(char, font_size)
+		if width + advance + dots > max_width:
+			break
+		width += advance
+	return text[:end] + '...', width + dots
+
+def _font_name(font_name: 'Font.fields | str') -> str:
+	if isinstance(font_name, Font.fields):
+		return font_name.value
+	return font_name
+
+## CHARTS TOOLS
+## _________________________________________________________________________________________________________________
+
+chart_colors = [colors.HexColor(color) for color in ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f')]
+
+@dataclass
+class ChartSeries:
+	'''
+	Data series of a chart (see `PDFREPORT.wr_chart`)
+
+	`Fields:`
+		- y: array-like, values
+		- x: array-like, numbers or datetime64 (0..n-1 by default), labels for a 'bar' series
+		- label: str, legend
+		- kind: str, 'line' | 'bar' | 'scatter'
+		- color: colors, `chart_colors` by default
+		- width: float, line width or marker size (points)
+	'''
+	y: Any
+	x: Any = None
+	label: str = None
+	kind: str = 'line'
+	color: colors = None
+	width: float = 1
+
+def decimate_minmax(x: 'np.ndarray', y: 'np.ndarray', buckets: int) -> Tuple['np.ndarray', 'np.ndarray']:
+	'''
+	Keep the first, last, min and max points of each of `buckets` equal x intervals (x sorted)
+
+	A line of the result drawn `buckets` pixels wide looks the same as the full series
+	'''
+	n = len(x)
+	if n <= 4 * buckets:
+		return x, y
+	edges = np.linspace(x[0], x[-1], buckets + 1)[:-1]
+	starts = np.unique(np.searchsorted(x, edges, side='left'))
+	counts = np.diff(np.append(starts, n))
+	ids = np.repeat(np.arange(len(starts)), counts)
+	keep = [starts, starts + counts - 1]
+	for reduce in (np.minimum, np.maximum):
+		extreme = reduce.reduceat(y, starts)
+		found = np.flatnonzero(y == extreme[ids])
+		_, first = np.unique(ids[found], return_index=True)
+		keep.append(found[first])
+	keep = np.unique(np.concatenate(keep))
+	return x[keep], y[keep]
+
+def decimate_lttb(x: 'np.ndarray', y: 'np.ndarray', threshold: int) -> Tuple['np.ndarray', 'np.ndarray']:
+	'''
+	Largest-Triangle-Three-Buckets: `threshold` points that keep the visual shape of the series (x sorted)
+	'''
+	n = len(x)
+	if threshold >= n or threshold < 3:
+		return x, y
+	every = (n - 2) / (threshold - 2)
+	keep = np.empty(threshold, dtype=np.int64)
+	keep[0], keep[-1] = 0, n - 1
+	a = 0
+	for i in range(threshold - 2):
+		start, end = int(i * every) + 1, int((i + 1) * every) + 1
+		next_end = min(int((i + 2) * every) + 1, n)
+		if next_end <= end:
+			avg_x, avg_y = x[-1], y[-1]
+		else:
+			avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+		areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+		a = start + int(np.argmax(areas))
+		keep[i + 1] = a
+	return x[keep], y[keep]
+
+def _nice_ticks(low: float, high: float, count: int = 5) -> List[float]:
+	'''
+	Round tick values (1, 2, 2.5, 5 x 10^n steps) between `low` and `high`
+	'''
+	span = high - low
+	if not span > 0:
+		return [low]
+	raw = span / count
+	magnitude = 10 ** math.floor(math.log10(raw))
+	step = magnitude * next(factor for factor in (1, 2, 2.5, 5, 10) if factor * magnitude >= raw)
+	first = math.ceil(low / step) * step
+	return [first + i * step for i in range(int((high - first) / step + 1e-9) + 1)]
+
+def _chart_values(series: ChartSeries) -> Tuple['np.ndarray', 'np.ndarray', List[str]]:
+	'''
+	Returns x (float), y (float) and the category labels of a series, points that aren't finite are dropped
+	'''
+	y = np.asarray(series.y, dtype=float)
+	labels = None
+	if series.x is None:
+		x = np.arange(len(y), dtype=float)
+	else:
+		x = np.asarray(series.x)
+		if np.issubdtype(x.dtype, np.datetime64):
+			x = x.astype('datetime64[s]').astype(np.int64).astype(float)
+		elif x.dtype.kind not in 'iuf':
+			labels = [str(value) for value in x]
+			x = np.arange(len(y), dtype=float)
+		else:
+			x = x.astype(float)
+	finite = np.isfinite(x) & np.isfinite(y)
+	if not finite.all():
+		x, y = x[finite], y[finite]
+		labels = [label for label, ok in zip(labels, finite) if ok] if labels else labels
+	if series.kind != 'scatter' and len(x) > 1 and np.any(np.diff(x) < 0):
+		order = np.argsort(x, kind='stable')
+		x, y = x[order], y[order]
+		labels = [labels[i] for i in order] if labels else labels
+	return x, y, labels
+
+def wrap_text(text: str, font_name: 'Font.fields | str', font_size: float, max_width: float) -> List[Tuple[str, float]]:
+	'''
+	Break a text in lines not wider than `max_width` (points)
+
+	Line breaks of the text are kept, words longer than a line are broken by characters.
+
+	`Returns:`
+		- List[(line: str, width: float)]
+	'''
+	widths = GlyphWidths.of(_font_name(font_name))
+	space = widths.width(' ', font_size)
+	lines: List[Tuple[str, float]] = []
+	for paragraph in text.split('\n'):
+		words: List[str] = []
+		line_width = 0.0
+		for word in paragraph.split():
+			word_width = widths.word_width(word, font_size)
+			## LONG WORD
+			if word_width > max_width:
+				if words:
+					lines.append((' '.join(words), line_width))
+					words, line_width = [], 0.0
+				chunk = ''
+				chunk_width = 0.0
+				for char in word:
+					char_width = widths.width(char, font_size)
+					if chunk and chunk_width + char_width > max_width:
+						lines.append((chunk, chunk_width))
+						chunk, chunk_width = '', 0.0
+					chunk += char
+					chunk_width += char_width
+				words, line_width = [chunk], chunk_width
+				continue
+			## NEW LINE
+			if words and line_width + space + word_width > max_width:
+				lines.append((' '.join(words), line_width))
+				words, line_width = [], 0.0
+			if words:
+				line_width += space
+			words.append(word)
+			line_width += word_width
+		lines.append((' '.join(words), line_width))
+	return lines
 		
 class PDFREPORT:
 	'''
 	Un A-4 a 72 ppp    595 x 842
-	Default Font: Arial
+	Default Font: Arial (or Liberation Sans, DejaVu Sans, Helvetica), see `FontRegistry`
 	'''
 	def __init__(self, 
 			filePath, ## path_file.pdf
@@ -100,7 +641,7 @@ class PDFREPORT:
 			marginBottom: float = cm*2, ## 1 cm
 			marginLeft: float = cm*1.5, ## 1.5 cm
 			marginRight: float = cm*1, ## 1 cm
-			fonts: Font.types = arial_fonts
+			fonts: 'Font.types | str' = None ## font_registry.types(), or a family name of font_registry
 		):
 		
 		self.PDF = canvas.Canvas(
@@ -109,6 +650,7 @@ class PDFREPORT:
 		)
 
 		## DOCUMENT NAME
+		self.docTitle = docTitle
 		if docTitle:
 			self.PDF.setTitle(docTitle)
 		# else:
@@ -117,11 +659,9 @@ class PDFREPORT:
 		## FONTS
 		# for f in fonts:
 		# 	pdfmetrics.registerFont(f.value)
-		self.fonts = fonts
-		pdfmetrics.registerFont(self.fonts.normal)
-		pdfmetrics.registerFont(self.fonts.bold)
-		pdfmetrics.registerFont(self.fonts.italic)
-		pdfmetrics.registerFont(self.fonts.italic_bold)
+		with metrics.timer('pdf.fonts', self):
+			self.fonts = font_registry.resolve(fonts)
+			font_registry.register(self.fonts)
 
 		
 		## PAGE SIZE / MARGINS
@@ -145,12 +685,107 @@ class PDFREPORT:
 		# self.X: float = 0.0
 		# self.Y: float = 0.0
 
+		## IMAGES CACHE (see wr_image)
+		self._images: Dict[tuple, _PDFImage] = {}
+		self._images_dir: str = None
+
+		## FLOW CURSOR (see add_* methods)
+		self.cursor_y: float = self.get_y()
+		self.page_number: int = 1
+
+		## PAGE TEMPLATES (see template)
+		self._templates: Dict[str, List[TemplateSlot]] = {}
+		self.page_template: str = None
+		self.date: datetime = datetime.now()
+		self.template_values: Dict[str, Any] = {}
+
 	def showPage(self):
-		self.PDF.showPage()
+		'''
+		Close the current page and start a new one, with the cursor on top and the same font, colours and line width
+		'''
+		pdf = self.PDF
+		state = (pdf._fontname, pdf._fontsize, pdf._leading, pdf._fillColorObj, pdf._strokeColorObj, pdf._lineWidth)
+		pdf.showPage()
+		self.page_number += 1
+		if self.page_template:
+			self.stamp_template(self.page_template)
+		font_name, font_size, leading, fill_color, stroke_color, line_width = state
+		pdf.setFont(font_name, font_size, leading)
+		pdf.setFillColor(fill_color)
+		pdf.setStrokeColor(stroke_color)
+		pdf.setLineWidth(line_width)
+		self.cursor_y = self.get_y()
 
 	def save(self):
-		self.PDF.save()
+		with metrics.timer('pdf.save', self):
+			self.PDF.save()
+		if metrics.enabled:
+			metrics.emit('pdf.pages', len(self.PDF._doc.Pages.pages), report=self)
+			file = self.PDF._filename
+			size = os.path.getsize(file) if isinstance(file, str) else file.tell() if hasattr(file, 'tell') else None
+			if size is not None:
+				metrics.emit('pdf.save.bytes', size, report=self)
+		if self._images_dir:
+			shutil.rmtree(self._images_dir, ignore_errors=True)
+			self._images_dir = None
 	
+	## PAGE TEMPLATES
+	## _________________________________________________________________________________________________________________
+	## A template (letterhead, footer, logo...) is recorded once as a Form XObject and every page draws it by reference
+
+	@contextmanager
+	def template(self, name: str, slots: List[TemplateSlot] = ()):
+		'''
+		Record a page template: everything drawn inside the `with` block (absolute positions) goes to the template
+
+		- `slots:` Texts that change on every page (page number, date...), see `TemplateSlot`
+
+		```python
+		with report.template('letterhead', slots=[TemplateSlot(report.get_x(), 30, 'Page {page}')]):
+			report.wr_image(report.get_x(), report.get_y(), 'logo.png', 50)
+			report.write(200, report.get_y() - 20, 'ACME Corp.', Font.fields.bold, 16)
+			report.wr_divider(report.get_y() - 60)
+		report.use_template('letterhead')
+		```
+		'''
+		pdf = self.PDF
+		pdf.beginForm(name)
+		try:
+			yield self
+		finally:
+			pdf.endForm()
+		self._templates[name] = list(slots)
+
+	def use_template(self, name: str = None) -> None:
+		'''
+		Draw the template `name` on the current page and on every new page (None to stop)
+
+		Call it before drawing the page, the template is drawn under its content.
+		'''
+		self.page_template = name
+		if name:
+			self.stamp_template(name)
+
+	def stamp_template(self, name: str) -> None:
+		'''
+		Draw the template `name` on the current page: the recorded content by reference and the slots with the page values
+		'''
+		pdf = self.PDF
+		pdf.doForm(name)
+		slots = self._templates[name]
+		if slots:
+			values = {'page': self.page_number, 'title': self.docTitle, 'date': self.date, **self.template_values}
+			pdf.saveState()
+			for slot in slots:
+				text = slot.text.format(**values)
+				font_name = _font_name(slot.font_name)
+				x = slot.x
+				if slot.align != 'left':
+					width = GlyphWidths.of(font_name).width(text, slot.font_size)
+					x -= width / 2 if slot.align == 'center' else width
+				self.write(x, slot.y, text, font_name, slot.font_size, slot.color)
+			pdf.restoreState()
+
 	def get_x(self, centered: bool = False) -> float:
 		if centered:
 			return (( self.PDF._pagesize[0] - self.marginLeft - self.marginRight ) / 2 ) + self.marginLeft
@@ -170,34 +805,81 @@ class PDFREPORT:
 		)
 		return self.get_x(), y - 20
 
-	def wr_image(self, x: float, y: float, img_path: str, size_percent: float = 100) -> None:
+	def _image(self, img_path: str, size_percent: float = 100, max_dpi: float = None) -> _PDFImage:
+		'''
+		Returns the cached image of a file (by path and modification time), at `size_percent` of its size in points
+
+		The size in points comes from the dpi of the image (72 by default).
+		With `max_dpi`, a downsampled copy is made once for every drawn size that needs it.
+		'''
+		path = os.path.abspath(img_path)
+		key = (path, os.path.getmtime(path))
+		image = self._images.get(key)
+		if image is None:
+			with Image.open(path) as img:
+				dpi = img.info.get('dpi', (72, 72))
+				dpi_x = dpi[0] if dpi[0] and dpi[0] > 0 else 72
+				dpi_y = dpi[1] if dpi[1] and dpi[1] > 0 else 72
+				w_px, h_px = img.size
+			image = self._images[key] = _PDFImage(path, w_px * (72 / dpi_x), h_px * (72 / dpi_y))
+		width, height = image.width * size_percent/100, image.height * size_percent/100
+
+		## DOWNSAMPLING
+		if max_dpi:
+			key_size = key + (round(width, 2), round(height, 2), max_dpi)
+			resized = self._images.get(key_size)
+			if resized is None:
+				resized = self._images[key_size] = _PDFImage(self._downsample(path, width, height, max_dpi), width, height)
+			return resized
+		return _PDFImage(image.source, width, height)
+
+	def _downsample(self, path: str, width: float, height: float, max_dpi: float) -> str:
+		'''
+		Returns the path of a copy of the image with `max_dpi` at selected size (points), or the same path if it isn't bigger
+		'''
+		with Image.open(path) as img:
+			w_px = max(math.ceil(width / 72 * max_dpi), 1)
+			h_px = max(math.ceil(height / 72 * max_dpi), 1)
+			if w_px >= img.size[0] and h_px >= img.size[1]:
+				return path
+			if self._images_dir is None:
+				self._images_dir = tempfile.mkdtemp(prefix='pyreports_')
+			is_jpeg = img.format == 'JPEG'
+			small = img.resize((w_px, h_px), Image.LANCZOS)
+			out_path = os.path.join(self._images_dir, f'{len(self._images)}.{"jpg" if is_jpeg else "png"}')
+			if is_jpeg:
+				small.save(out_path, format='JPEG', quality=90)
+			else:
+				small.save(out_path, format='PNG')
+		return out_path
+
+	def wr_image(self, x: float, y: float, img_path: str, size_percent: float = 100, max_dpi: float = None) -> tuple[float, float]:
+		'''
+		Draw an image with its top-left corner in (x, y), sized from its dpi (72 by default)
+
+		- `size_percent:` Scale (100)
+		- `max_dpi:` Downsample the image if it has more resolution at the drawn size (None)
+
+		Every image file is read once, stored once in the document and reused on every page.
+		JPEG files are embedded without transcoding.
+
+		Returns:
+
+		- x, y : float (bottom-left corner of the image, or (x, y) unchanged if the file doesn't exist)
+		'''
 		if not os.path.exists(img_path):
-			return
-		img = Image.open(img_path)
-		
-		if img.mode not in ("RGB", "RGBA"):
-			img = img.convert("RGB")
-
-		## Crea un buffer en memoria con formato PNG
-		buf = BytesIO()
-		img.save(buf, format="PNG")
-		buf.seek(0)
-		reader = ImageReader(buf)
-
-		## dpi size
-		dpi = img.info.get('dpi', (72, 72))
-		w_px, h_px = img.size
-		w_pt = w_px * (72 / dpi[0])
-		h_pt = h_px * (72 / dpi[1])
-
-		self.PDF.drawImage(
-			reader, 
-			x=x, 
-			y=y-h_pt, 
-			width= img.size[0] * size_percent/100, 
-			height= img.size[1] * size_percent/100,
-			mask='auto'
-		)
+			return x, y
+		with metrics.timer('pdf.image_decode', self):
+			image = self._image(img_path, size_percent, max_dpi)
+			self.PDF.drawImage(
+				image.source, 
+				x=x, 
+				y=y-image.height, 
+				width=image.width, 
+				height=image.height,
+				mask='auto'
+			)
+		return x, y - image.height
 
 	def write(self, 
 		   x: float, y: float, text: str, 
@@ -220,6 +902,66 @@ class PDFREPORT:
 
 		return txt.getX(), txt.getY()
 
+	def write_runs(self, x: float, y: float, runs: Iterable['str | Tuple[str, TextStyle]'], style: TextStyle = None) -> tuple[float, float]:
+		'''
+		Write runs of text in a single text object, font and colour are only set when they change
+
+		- `runs:` (text, TextStyle) or text with `style`. A '\\n' in the text starts a new line.
+		- `style:` Default style (TextStyle())
+
+		```python
+		bold, red = TextStyle(Font.fields.bold, 10), TextStyle(font_size=10, color=colors.red)
+		report.write_runs(x, y, [('Total: ', bold), ('-25.3 €\\n', red), ('Checked', bold)])
+		```
+
+		Every line moves down its biggest font size + `spacing`.
+
+		Returns:
+
+		- x, y : float (end of the last run)
+		'''
+		default = style if style else TextStyle()
+		txt = self.PDF.beginText(x, y)
+		font_name = font_size = color = leading = None
+		line_size = 0.0
+		for run in runs:
+			text, run_style = (run, default) if isinstance(run, str) else run
+			run_font_name = _font_name(run_style.font_name)
+			if run_font_name != font_name or run_style.font_size != font_size:
+				font_name, font_size = run_font_name, run_style.font_size
+				txt._setFont(font_name, font_size) ## Without leading, it's set at the end of the line
+			if run_style.color != color:
+				color = run_style.color
+				txt.setFillColor(color)
+			*lines, last = text.split('\n')
+			for line in lines:
+				if line:
+					line_size = max(line_size, font_size)
+				line_leading = (line_size if line_size else font_size) + self.spacing
+				if line_leading != leading:
+					leading = line_leading
+					txt.setLeading(leading)
+				txt.textLine(line)
+				line_size = 0.0
+			if last:
+				line_size = max(line_size, font_size)
+				txt.textOut(last)
+		self.PDF.drawText(txt)
+
+		return txt.getX(), txt.getY()
+
+	def write_lines(self, 
+		   x: float, y: float, lines: Iterable[str], 
+		   font_name: Font.fields | str = Font.fields.normal,
+		   font_size: float = 12,
+		   color: colors = colors.black,
+		   ) -> tuple[float, float]:
+		'''
+		Write lines with the same style in a single text object (see `write_runs`)
+		'''
+		style = TextStyle(font_name, font_size, color)
+		return self.write_runs(x, y, ((line + '\n', style) for line in lines))
+
 	def wr_normal(self, y: float, text: str, centered: bool = False) -> tuple[float, float]:
 		# font_name = fontTypes.normal.name
 		# font_size = 12
@@ -286,13 +1028,942 @@ class PDFREPORT:
 
 		return new_x, new_y
 
+	def get_width(self) -> float:
+		'''
+		Returns the usable width of the page, between `marginLeft` and `marginRight`
+		'''
+		return self.PDF._pagesize[0] - self.marginLeft - self.marginRight
+
+	def wr_paragraph(self, 
+		   y: float, text: str, 
+		   font_name: Font.fields | str = Font.fields.normal,
+		   font_size: float = 12,
+		   color: colors = colors.black,
+		   centered: bool = False,
+		   ) -> tuple[float, float]:
+		'''
+		Write a text broken in lines to the width between the margins (see `wrap_text`)
+
+		All the lines are drawn in the same text object
+		'''
+		font_name = _font_name(font_name)
+		lines = wrap_text(text, font_name, font_size, self.get_width())
+		return self._draw_lines(y, lines, font_name, font_size, color, centered)
+
+	def _draw_lines(self, y: float, lines: List[Tuple[str, float]], font_name: str, font_size: float, color: colors, centered: bool) -> tuple[float, float]:
+		'''
+		Draw lines of `wrap_text` in a single text object
+		'''
+		txt = self.PDF.beginText()
+		txt.setTextOrigin(self.get_x(), y)
+		txt.setFont(font_name, font_size)
+		txt.setLeading(font_size + self.spacing)
+		txt.setFillColor(color)
+		for line, width in lines:
+			if centered:
+				txt.setTextOrigin(self.get_x(centered=True) - (width / 2), txt.getY())
+			txt.textLine(line)
+		self.PDF.drawText(txt)
+
+		return txt.getX(), txt.getY()
+
+
+	## FLOW LAYOUT
+	## _________________________________________________________________________________________________________________
+	## The add_* methods write on the cursor (`cursor_y`), measure each block before drawing it
+	## and start a new page when it doesn't fit above `marginBottom`
+
+	def fits(self, height: float) -> bool:
+		'''
+		Returns True if a block of `height` fits between the cursor and the bottom margin
+		'''
+		return self.cursor_y - height >= self.marginBottom
+
+	def ensure(self, height: float) -> None:
+		'''
+		Start a new page if a block of `height` doesn't fit in the current one (unless the page is empty)
+		'''
+		if not self.fits(height) and self.cursor_y < self.get_y():
+			self.showPage()
+
+	def add_space(self, height: float) -> None:
+		'''
+		Move the cursor down, a new page is started if needed
+		'''
+		if self.fits(height):
+			self.cursor_y -= height
+		else:
+			self.showPage()
+
+	def add_paragraph(self, 
+		   text: str, 
+		   font_name: Font.fields | str = Font.fields.normal,
+		   font_size: float = 12,
+		   color: colors = colors.black,
+		   centered: bool = False,
+		   ) -> None:
+		'''
+		Write a paragraph on the cursor, broken in lines and split across pages when needed
+		'''
+		font_name = _font_name(font_name)
+		leading = font_size + self.spacing
+		lines = wrap_text(text, font_name, font_size, self.get_width())
+		while lines:
+			count = int((self.cursor_y - self.marginBottom) // leading)
+			if count <= 0:
+				self.showPage()
+				count = max(int((self.cursor_y - self.marginBottom) // leading), 1)
+			_, self.cursor_y = self._draw_lines(self.cursor_y, lines[:count], font_name, font_size, color, centered)
+			lines = lines[count:]
+			if lines:
+				self.showPage()
+
+	def add_normal(self, text: str, centered: bool = False) -> None:
+		'''
+		`wr_normal` on the cursor
+		'''
+		self.ensure(12 + self.spacing)
+		_, self.cursor_y = self.wr_normal(self.cursor_y, text, centered)
+
+	def add_header1(self, text: str, centered: bool = False) -> None:
+		'''
+		`wr_header1` on the cursor
+		'''
+		self.ensure(14 + self.spacing)
+		_, self.cursor_y = self.wr_header1(self.cursor_y, text, centered)
+
+	def add_divider(self, line_width: float = 1.5) -> None:
+		'''
+		`wr_divider` on the cursor
+		'''
+		self.ensure(20)
+		_, self.cursor_y = self.wr_divider(self.cursor_y, line_width)
+
+	def add_image(self, img_path: str, size_percent: float = 100, centered: bool = False, max_dpi: float = None) -> None:
+		'''
+		`wr_image` on the cursor
+		'''
+		if not os.path.exists(img_path):
+			return
+		image = self._image(img_path, size_percent)
+		self.ensure(image.height)
+		x = self.get_x(centered) - (image.width / 2 if centered else 0)
+		_, y = self.wr_image(x, self.cursor_y, img_path, size_percent, max_dpi)
+		self.cursor_y = y - self.spacing
+
+	def add_table(self, 
+		   dataFrame, 
+		   font_size: float = 9, 
+		   chunk_size: int = 1000, 
+		   sample_size: int = 1000, 
+		   float_format: str = '{:.6g}',
+		   padding: float = 3,
+		   ) -> None:
+		'''
+		Draw a Pandas DataFrame as a table on the cursor, with the header repeated on every page
+
+		- `dataFrame:` DataFrame, or an iterable of DataFrames with the same columns (chunks read lazily)
+		- `font_size:` Font size of the cells (9)
+		- `chunk_size:` Rows converted to text at once, memory is bounded by the chunk, not by the table (1000)
+		- `sample_size:` First rows (of the first chunk) used to compute the column widths (1000), longer texts are cut
+		- `float_format:` Format of float values ('{:.6g}')
+		- `padding:` Horizontal padding of the cells (3)
+
+		If the table is wider than the space between margins the widest columns are narrowed, numeric columns are right aligned
+		'''
+		if hasattr(dataFrame, 'columns'):
+			chunks = iter((dataFrame,))
+		else:
+			chunks = iter(dataFrame)
+			dataFrame = next(chunks, None)
+			if dataFrame is None:
+				return
+			chunks = itertools.chain((dataFrame,), chunks)
+		if len(dataFrame.columns) == 0:
+			return ## Nothing to draw, not even a header
+		normal, bold = Font.fields.normal.value, Font.fields.bold.value
+		normal_widths, bold_widths = GlyphWidths.of(normal), GlyphWidths.of(bold)
+		headers = [str(column) for column in dataFrame.columns]
+		numeric = [dtype.kind in 'iuf' for dtype in dataFrame.dtypes]
+		row_height = font_size + self.spacing
+
+		## COLUMN WIDTHS
+		sample = _table_cells(dataFrame.iloc[:sample_size], float_format)
+		col_widths = [
+			max([bold_widths.width(header, font_size)] + [normal_widths.width(text, font_size) for text in texts]) + 2 * padding
+			for header, texts in zip(headers, sample)
+		]
+		col_widths = _fit_widths(col_widths, self.get_width())
+		xs = [self.get_x()]
+		for width in col_widths[:-1]:
+			xs.append(xs[-1] + width)
+		x_end = xs[-1] + col_widths[-1]
+
+		## Position and text of repeated values are computed once per column
+		header_cells: List[Dict[str, Tuple[float, str]]] = [{} for _ in headers]
+		row_cells: List[Dict[str, Tuple[float, str]]] = [{} for _ in headers]
+
+		def draw_row(txt, texts: List[str], widths: GlyphWidths, y: float, cells: List[Dict[str, Tuple[float, str]]]) -> None:
+			for i, text in enumerate(texts):
+				if not text:
+					continue
+				cell = cells[i].get(text)
+				if cell is None:
+					cut, width = _cut_text(text, widths, font_size, col_widths[i] - 2 * padding)
+					x = xs[i] + col_widths[i] - padding - width if numeric[i] else xs[i] + padding
+					if len(cells[i]) >= 10000:
+						cells[i].clear()
+					cell = cells[i][text] = (x, cut)
+				txt.setTextOrigin(cell[0], y)
+				txt.textOut(cell[1])
+
+		def begin_page():
+			''' Header of the table, returns the text object of the page rows '''
+			self.ensure(2 * row_height)
+			txt = self.PDF.beginText()
+			txt.setFont(bold, font_size)
+			draw_row(txt, headers, bold_widths, self.cursor_y, header_cells)
+			self.PDF.drawText(txt)
+			line_y = self.cursor_y - font_size * 0.3
+			self.PDF.setLineWidth(0.75)
+			self.PDF.line(xs[0], line_y, x_end, line_y)
+			self.cursor_y -= row_height
+			txt = self.PDF.beginText()
+			txt.setFont(normal, font_size)
+			return txt
+
+		## ROWS
+		txt = begin_page()
+		for chunk in chunks:
+			for start in range(0, len(chunk.index), chunk_size):
+				columns = _table_cells(chunk.iloc[start:start + chunk_size], float_format)
+				for texts in zip(*columns):
+					if not self.fits(row_height):
+						self.PDF.drawText(txt)
+						self.showPage()
+						txt = begin_page()
+					draw_row(txt, texts, normal_widths, self.cursor_y, row_cells)
+					self.cursor_y -= row_height
+		self.PDF.drawText(txt)
+
+
+	## CHARTS
+	## _________________________________________________________________________________________________________________
+	## Vector charts drawn on the canvas, series are decimated to the width of the chart (`resolution` points per pt)
+
+	def wr_chart(self, 
+		   x: float, y: float, 
+		   series: List[ChartSeries], 
+		   width: float = None, 
+		   height: float = 200, 
+		   title: str = None, 
+		   decimation: str = 'minmax', 
+		   resolution: float = 2, 
+		   font_size: float = 7,
+		   ) -> tuple[float, float]:
+		'''
+		Draw a line, bar and/or scatter chart with its top-left corner in (x, y)
+
+		- `series:` List[ChartSeries], NumPy arrays, lists or Pandas Series
+		- `width:` Width of the chart (width between margins)
+		- `decimation:` 'minmax' (min/max per pixel) | 'lttb' (Largest-Triangle-Three-Buckets) | None
+		- `resolution:` Points of a decimated line per pt of width (2 = 144 dpi)
+
+		```python
+		t = np.linspace(0, 100, 5_000_000)
+		report.wr_chart(report.get_x(), y, [ChartSeries(np.sin(t), t, 'sin')], title='Signal')
+		```
+
+		The size of the output depends on the chart width, not on the length of the series.
+
+		Returns:
+
+		- x, y : float (bottom-left corner of the chart)
+		'''
+		pdf = self.PDF
+		width = width if width else self.get_width()
+		normal, bold = Font.fields.normal.value, Font.fields.bold.value
+		widths = GlyphWidths.of(normal)
+		values = [_chart_values(item) for item in series]
+		date_axis = any(item.x is not None and np.issubdtype(np.asarray(item.x).dtype, np.datetime64) for item in series)
+		labels = next((item_labels for _, _, item_labels in values if item_labels), None)
+
+		## RANGES
+		xs = [item_x for item_x, _, _ in values if len(item_x)]
+		ys = [item_y for _, item_y, _ in values if len(item_y)]
+		x_min = min(float(item.min()) for item in xs) if xs else 0.0
+		x_max = max(float(item.max()) for item in xs) if xs else 1.0
+		y_min = min(float(item.min()) for item in ys) if ys else 0.0
+		y_max = max(float(item.max()) for item in ys) if ys else 1.0
+		if any(item.kind == 'bar' for item in series):
+			x_min, x_max = x_min - 0.5, x_max + 0.5
+			y_min, y_max = min(y_min, 0.0), max(y_max, 0.0)
+		if x_max <= x_min:
+			x_min, x_max = x_min - 0.5, x_max + 0.5
+		if y_max <= y_min:
+			y_min, y_max = y_min - 0.5, y_max + 0.5
+		y_ticks = _nice_ticks(y_min, y_max)
+		y_min, y_max = min(y_min, y_ticks[0]), max(y_max, y_ticks[-1])
+
+		## LAYOUT
+		def y_label(value: float) -> str:
+			return f'{round(value, 10):g}'
+
+		def x_label(value: float) -> str:
+			if labels:
+				index = int(round(value))
+				return labels[index] if 0 <= index < len(labels) and abs(value - index) < 1e-9 else ''
+			if date_axis:
+				return np.datetime_as_string(np.datetime64(int(value), 's'), unit='D' if x_max - x_min > 2 * 86400 else 'm').replace('T', ' ')
+			return f'{round(value, 10):g}'
+
+		top = y - (font_size + 2 + self.spacing if title else 0)
+		left = x + max(widths.width(y_label(tick), font_size) for tick in y_ticks) + 4
+		bottom = y - height + 2 * font_size
+		right = x + width
+		plot_w, plot_h = right - left, top - bottom
+		sx, sy = plot_w / (x_max - x_min), plot_h / (y_max - y_min)
+		if labels and len(labels) <= max(plot_w // (4 * font_size), 1):
+			x_ticks = list(range(len(labels)))
+		else:
+			x_ticks = [tick for tick in _nice_ticks(x_min, x_max, max(min(int(plot_w // 80), 8), 2)) if x_min <= tick <= x_max]
+		buckets = max(int(plot_w * resolution), 2)
+
+		## AXES, GRID AND LABELS
+		pdf.saveState()
+		pdf.setLineWidth(0.25)
+		pdf.setStrokeColor(colors.lightgrey)
+		for tick in y_ticks:
+			ty = bottom + (tick - y_min) * sy
+			pdf.line(left, ty, right, ty)
+		pdf.setLineWidth(0.75)
+		pdf.setStrokeColor(colors.black)
+		pdf.rect(left, bottom, plot_w, plot_h, stroke=1, fill=0)
+		txt = pdf.beginText()
+		txt.setFont(normal, font_size)
+		txt.setFillColor(colors.black)
+		for tick in y_ticks:
+			text = y_label(tick)
+			txt.setTextOrigin(left - 3 - widths.width(text, font_size), bottom + (tick - y_min) * sy - font_size / 3)
+			txt.textOut(text)
+		for tick in x_ticks:
+			text = x_label(tick)
+			text_w = widths.width(text, font_size)
+			txt.setTextOrigin(min(left + (tick - x_min) * sx - text_w / 2, right - text_w), bottom - font_size - 2)
+			txt.textOut(text)
+		if title:
+			txt.setFont(bold, font_size + 2)
+			txt.setTextOrigin(left + (plot_w - GlyphWidths.of(bold).width(title, font_size + 2)) / 2, y - font_size - 2)
+			txt.textOut(title)
+		pdf.drawText(txt)
+
+		## SERIES
+		clip = pdf.beginPath()
+		clip.rect(left, bottom, plot_w, plot_h)
+		pdf.clipPath(clip, stroke=0, fill=0)
+		bars = [item for item in series if item.kind == 'bar']
+		legend = []
+		for i, (item, (item_x, item_y, _)) in enumerate(zip(series, values)):
+			color = item.color if item.color else chart_colors[i % len(chart_colors)]
+			if item.label:
+				legend.append((item.label, color))
+			if not len(item_x):
+				continue
+			if item.kind == 'scatter':
+				## One marker per cell of the marker size
+				px, py = left + (item_x - x_min) * sx, bottom + (item_y - y_min) * sy
+				cell = max(item.width, 0.5)
+				_, first = np.unique(np.floor(px / cell) * (plot_h / cell + 1) + np.floor(py / cell), return_index=True)
+				path = pdf.beginPath()
+				half = item.width / 2
+				for mx, my in zip(px[first].tolist(), py[first].tolist()):
+					path.rect(mx - half, my - half, item.width, item.width)
+				pdf.setFillColor(color)
+				pdf.drawPath(path, stroke=0, fill=1)
+			elif item.kind == 'bar' and len(item_x) <= buckets / 2:
+				slot = min(np.min(np.diff(item_x)) if len(item_x) > 1 else 1.0, 1.0) * sx * 0.8
+				bar_w = slot / len(bars)
+				offset = -slot / 2 + bars.index(item) * bar_w
+				base = bottom + (0.0 - y_min) * sy
+				path = pdf.beginPath()
+				for bx, by in zip((left + (item_x - x_min) * sx + offset).tolist(), (bottom + (item_y - y_min) * sy).tolist()):
+					path.rect(bx, min(base, by), bar_w, abs(by - base))
+				pdf.setFillColor(color)
+				pdf.drawPath(path, stroke=0, fill=1)
+			elif item.kind == 'bar':
+				## Bars thinner than a pixel: one bar per pixel, from the min to the max of its bars
+				pixel = plot_w / buckets
+				cells = np.minimum(((item_x - x_min) * sx / pixel).astype(np.int64), buckets - 1)
+				starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+				lows = np.minimum(np.minimum.reduceat(item_y, starts), 0.0)
+				highs = np.maximum(np.maximum.reduceat(item_y, starts), 0.0)
+				path = pdf.beginPath()
+				for cell, low, high in zip(cells[starts].tolist(), (bottom + (lows - y_min) * sy).tolist(), (bottom + (highs - y_min) * sy).tolist()):
+					path.rect(left + cell * pixel, low, pixel, high - low)
+				pdf.setFillColor(color)
+				pdf.drawPath(path, stroke=0, fill=1)
+			else:
+				if decimation == 'lttb':
+					item_x, item_y = decimate_lttb(item_x, item_y, buckets)
+				elif decimation:
+					item_x, item_y = decimate_minmax(item_x, item_y, buckets)
+				px = (left + (item_x - x_min) * sx).tolist()
+				py = (bottom + (item_y - y_min) * sy).tolist()
+				path = pdf.beginPath()
+				path.moveTo(px[0], py[0])
+				for point in zip(px[1:], py[1:]):
+					path.lineTo(*point)
+				pdf.setLineWidth(item.width)
+				pdf.setLineJoin(1)
+				pdf.setStrokeColor(color)
+				pdf.drawPath(path, stroke=1, fill=0)
+		pdf.restoreState()
+
+		## LEGEND
+		if legend:
+			pdf.saveState()
+			legend_w = max(widths.width(label, font_size) for label, _ in legend) + font_size + 8
+			ly = top - font_size - 3
+			for label, color in legend:
+				pdf.setFillColor(color)
+				pdf.rect(right - legend_w, ly, font_size * 0.8, font_size * 0.8, stroke=0, fill=1)
+				ly -= font_size + self.spacing
+			self.write_lines(right - legend_w + font_size + 2, top - font_size - 3, [label for label, _ in legend], normal, font_size)
+			pdf.restoreState()
+
+		return x, y - height
+
+	def add_chart(self, 
+		   series: List[ChartSeries], 
+		   height: float = 200, 
+		   title: str = None, 
+		   decimation: str = 'minmax', 
+		   resolution: float = 2, 
+		   font_size: float = 7,
+		   ) -> None:
+		'''
+		`wr_chart` on the cursor, with the width between margins
+		'''
+		self.ensure(height)
+		_, y = self.wr_chart(self.get_x(), self.cursor_y, series, None, height, title, decimation, resolution, font_size)
+		self.cursor_y = y - self.spacing
+
+
+## PRECOMPILED TEMPLATES
+## _________________________________________________________________________________________________________________
+## The static layout is drawn once: its content stream, the codes of its font subsets and its encoded images are kept
+## and added to every document as they are, so a document only draws its variable data
+
+def _unregistered(obj: Any) -> Any:
+	'''
+	Copy of a PDF object without the name of the document that registered it
+	'''
+	obj = copy.copy(obj)
+	vars(obj).pop('__InternalName__', None)
+	return obj
+
+class PDFTemplate:
+	'''
+	Static layout compiled once and rendered for many documents (mail-merge)
+
+	Every page of a document draws the layout by reference (see `PDFREPORT.template`), then the `slots` with
+	the values of the document and, on the first page, the `fill` function (tables, totals...).
+
+	`Args:`
+		- build: Callable[[PDFREPORT], None], draws the static layout (absolute positions)
+		- slots: List[TemplateSlot], texts with fields of the values, ex: TemplateSlot(350, 750, '{customer}')
+		- fill: Callable[[PDFREPORT, dict], None], draws the rest of the variable data, ex: `report.add_table(values['items'])`
+		- report_args: pagesize, margins and fonts of `PDFREPORT` (the flow of `fill` starts at `marginTop`)
+
+	```python
+	def letterhead(report: PDFREPORT):
+		report.wr_image(report.get_x(), report.get_y(), 'logo.png', 50)
+		report.write(report.get_x(), 700, 'Invoice', Font.fields.bold, 18)
+
+	invoice = PDFTemplate(letterhead, [TemplateSlot(350, 750, '{customer}', font_size=12)],
+		fill=lambda report, values: report.add_table(values['items']), marginTop=cm*6)
+	for customer, items in invoices:
+		invoice.render(f'{customer}.pdf', {'customer': customer, 'items': items})
+	```
+
+	***Note:*** Shadings, separation colours, transparency and links aren't supported in the layout.
+	'''
+	NAME = 'pyreports_layout'
+
+	def __init__(self,
+			build: Callable[['PDFREPORT'], None],
+			slots: List[TemplateSlot] = (),
+			fill: Callable[['PDFREPORT', Dict[str, Any]], None] = None,
+			**report_args
+		) -> None:
+		self.slots = list(slots)
+		self.fill = fill
+		self.report_args = report_args
+
+		report = PDFREPORT(io.BytesIO(), None, **report_args)
+		pdf = report.PDF
+		doc = pdf._doc
+		self._base_fonts = list(doc.fontMapping)
+		pdf.beginForm(self.NAME)
+		try:
+			build(report)
+			if pdf._colorsUsed or pdf._shadingUsed or pdf._annotationrefs or pdf._extgstate._c:
+				raise ValueError("Shadings, separation colours, transparency and links aren't supported in a compiled template")
+			self._forms: List[str] = list(dict.fromkeys(pdf._formsinuse))
+			pdf.endForm()
+		finally:
+			if report._images_dir:
+				shutil.rmtree(report._images_dir, ignore_errors=True)
+
+		## CONTENT STREAM: encoded once
+		form = doc.idToObject[doc.getXObjectName(self.NAME)]
+		self._stream: bytes = asBytes(form.stream)
+		self._compressed: bool = bool(form.compression)
+		if self._compressed:
+			self._stream = zlib.compress(self._stream)
 
+		## FONTS: characters in the order of their codes, fonts in the order of their names (F2, F3...)
+		self._fonts: List[Tuple[str, str]] = []
+		for font_name in doc.fontMapping:
+			if font_name in self._base_fonts:
+				continue
+			font = pdfmetrics.getFont(font_name)
+			chars = None
+			if font._dynamicFont:
+				assignments = font.state[doc].assignments
+				chars = ''.join(chr(char) for char in sorted(assignments, key=assignments.get))
+			self._fonts.append((font_name, chars))
+		self._font_mapping = dict(doc.fontMapping)
 
-def _from_markdown(md_path: str, pdf_path: str):
-	''' ⚠️INCOMPLETE
+		## IMAGES: the encoded XObjects and their soft masks
+		self._objects: List[Tuple[str, Any]] = []
+		for name in self._forms:
+			reg_name = doc.getXObjectName(name)
+			obj = doc.idToObject[reg_name]
+			self._objects.append((reg_name, _unregistered(obj)))
+			smask = getattr(obj, 'smask', None)
+			if smask is not None:
+				self._objects.append((smask.name, _unregistered(doc.idToObject[smask.name])))
+
+	def install(self, report: 'PDFREPORT') -> None:
+		'''
+		Add the layout to `report` as the page template `PDFTemplate.NAME` (see `PDFREPORT.use_template`)
+
+		Call it before any text is drawn: the font subsets of the report must start as the compiled ones.
+		'''
+		pdf = report.PDF
+		doc = pdf._doc
+		if list(doc.fontMapping) != self._base_fonts:
+			raise ValueError("A compiled template must be installed before any text is drawn")
+		for font_name, chars in self._fonts:
+			if chars is None:
+				doc.getInternalFontName(font_name)
+			else:
+				font = pdfmetrics.getFont(font_name)
+				font.splitString(chars, doc)
+				font.getSubsetInternalName(0, doc)
+		for reg_name, obj in self._objects:
+			if reg_name not in doc.idToObject:
+				doc.Reference(copy.copy(obj), reg_name)
+
+		contents = pdfdoc.PDFStream(content=self._stream)
+		if self._compressed:
+			contents.dictionary['Filter'] = pdfdoc.PDFArray([pdfdoc.PDFName(pdfdoc.PDFZCompress.pdfname)])
+		pdf.beginForm(self.NAME)
+		pdf._formsinuse.extend(self._forms)
+		pdf.endForm(Contents=contents)
+		report._templates[self.NAME] = self.slots
+
+	def render(self, filePath, values: Dict[str, Any] = None, docTitle: str = None) -> int:
+		'''
+		Save a document with the layout and `values`, returns its number of pages
+
+		- `filePath:` path or file object
+		'''
+		values = values if values else {}
+		report = PDFREPORT(filePath, docTitle, **self.report_args)
+		report.template_values = values
+		self.install(report)
+		report.use_template(self.NAME)
+		if self.fill:
+			self.fill(report, values)
+		report.save()
+		return report.page_number
+
+
+## PARALLEL RENDERING
+## _________________________________________________________________________________________________________________
+
+## Characters assigned first, in the same order, in every part: the font subsets of the parts are identical and merged only once
+_SHARED_CHARSET = ''.join(chr(code) for code in range(32, 127)) + ''.join(chr(code) for code in range(0xA1, 0x100)) + '€‘’‚“”„†‡•…‰‹›–—™'
+
+def _render_part(payload: tuple) -> Tuple[int, str]:
+	'''
+	Worker: render a part of the document in its own `PDFREPORT`, starting at its page number
+	'''
+	index, path, docTitle, build, part, first_page, charset, report_args = payload
+	report = PDFREPORT(path, docTitle, **report_args)
+	report.page_number = first_page
+	report.PDF._pageNumber = first_page
+	if charset:
+		doc = report.PDF._doc
+		for font in (report.fonts.normal, report.fonts.bold, report.fonts.italic, report.fonts.italic_bold):
+			if getattr(font, '_dynamicFont', False):
+				font.splitString(charset, doc)
+	build(report, part)
+	report.save()
+	return index, path
+
+def render_parallel(
+		filePath: str, 
+		docTitle: str, 
+		build: Callable[['PDFREPORT', Any], None], 
+		parts: Sequence[Any], 
+		pages: 'int | Sequence[int]' = None, 
+		renumber: bool = True, 
+		max_workers: int = None, 
+		charset: str = _SHARED_CHARSET, 
+		**report_args
+	) -> int:
+	'''
+	Render a large document in parallel: every part is a page range rendered by `build(report, part)` 
+	in a worker process with its own `PDFREPORT`, then the parts are merged into `filePath` (needs `pypdf`)
+
+	`Args:`
+		- build: Callable(report, part), must be a module level function. Each part must start on a new page.
+		- parts: Sequence, data of each page range (DataFrame chunks, sections, ...)
+		- pages: int | Sequence[int], expected pages of each part, to set `report.page_number` of every part in the first run
+		- renumber: bool, render again the parts whose first page was not known (`pages` missing or wrong). 
+		Use False if `build` doesn't print page numbers.
+		- max_workers: int, processes (os.cpu_count() by default)
+		- charset: str, characters embedded in the same font subset in every part. Other characters are embedded per part.
+		- report_args: pagesize, margins and fonts of `PDFREPORT`. Fonts are sent to the workers as 
+		their family name or font files (see `FontRegistry.portable`) and parsed once per worker.
+
+	`Returns:`
+		- int, pages of the document
+
+	```python
+	def build(report: PDFREPORT, chunk: pd.DataFrame):
+		report.add_table(chunk)
+
+	render_parallel('big.pdf', 'Big Report', build, [df[i:i + 20000] for i in range(0, len(df), 20000)])
+	```
+
+	***Note:*** Fonts and images used by several parts are written only once in the merged document.
+	'''
+	try:
+		import pypdf
+	except ImportError:
+		raise ImportError("render_parallel needs pypdf (pip install pypdf)") from None
+	from concurrent.futures import ProcessPoolExecutor
+	parts = list(parts)
+	if 'fonts' in report_args:
+		report_args['fonts'] = font_registry.portable(report_args['fonts'])
+	if isinstance(pages, int):
+		pages = [pages] * len(parts)
+	expected = list(pages) if pages is not None else [1] * len(parts)
+
+	def first_pages(counts: List[int]) -> List[int]:
+		starts, page = [], 1
+		for count in counts:
+			starts.append(page)
+			page += count
+		return starts
+
+	folder = tempfile.mkdtemp(prefix='pyreports_', dir=os.path.dirname(os.path.abspath(filePath)))
+	paths = [os.path.join(folder, f'part_{index:06d}.pdf') for index in range(len(parts))]
+	try:
+		with ProcessPoolExecutor(max_workers=max_workers) as executor:
+			def render(indexes: List[int], starts: List[int]) -> None:
+				payloads = [(index, paths[index], docTitle, build, parts[index], starts[index], charset, report_args) for index in indexes]
+				for _ in executor.map(_render_part, payloads):
+					pass
+
+			starts = first_pages(expected)
+			render(range(len(parts)), starts)
+			counts = [len(pypdf.PdfReader(path).pages) for path in paths]
+			if renumber:
+				## Page ranges that didn't start on the expected page
+				real_starts = first_pages(counts)
+				wrong = [index for index in range(len(parts)) if real_starts[index] != starts[index]]
+				if wrong:
+					render(wrong, real_starts)
+
+		## MERGE
+		writer = pypdf.PdfWriter()
+		for path in paths:
+			writer.append(path)
+		if docTitle:
+			writer.add_metadata({'/Title': docTitle})
+		objects = -1
+		while objects != len(writer._objects) - writer._objects.count(None):
+			## Repeated until nothing changes: a font is the same only after its font file was merged
+			objects = len(writer._objects) - writer._objects.count(None)
+			writer.compress_identical_objects()
+		with open(filePath, 'wb') as file:
+			writer.write(file)
+	finally:
+		shutil.rmtree(folder, ignore_errors=True)
+	return sum(counts)
+
+## MARKDOWN
+## _________________________________________________________________________________________________________________
+
+_md_heading = re.compile(r'^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+_md_rule = re.compile(r'^ {0,3}([-*_])(?:\s*\1){2,}\s*$')
+_md_item = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+_md_fence = re.compile(r'^\s*(```|~~~)')
+_md_image = re.compile(r'^\s*!\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)\s*$')
+_md_table_separator = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+_md_inline = (
+	(re.compile(r'!\[([^\]]*)\]\([^)]*\)'), r'\1'), ## images
+	(re.compile(r'\[([^\]]+)\]\([^)]*\)'), r'\1'), ## links
+	(re.compile(r'(\*\*|__)(.+?)\1'), r'\2'), ## bold
+	(re.compile(r'(?<![\w*])([*_])(?!\s)(.+?)(?<!\s)\1(?![\w*])'), r'\2'), ## italic
+	(re.compile(r'`([^`]+)`'), r'\1'), ## code
+)
+
+def _md_text(text: str) -> str:
+	'''
+	Text of a Markdown line without the inline marks (bold, italic, code, links)
+	'''
+	if any(mark in text for mark in '*_`[!'):
+		for pattern, repl in _md_inline:
+			text = pattern.sub(repl, text)
+	return text.strip()
+
+def _md_cells(line: str) -> List[str]:
+	line = line.strip()
+	if line.startswith('|'):
+		line = line[1:]
+	if line.endswith('|'):
+		line = line[:-1]
+	return [_md_text(cell) for cell in line.split('|')]
+
+class _MarkdownWriter:
+	'''
+	Markdown to `PDFREPORT`, one line at a time: every block is drawn as soon as it ends
+
+	Only the current block is kept in memory (a paragraph, a list item, some lines of code or a table row)
+	'''
+	code_font = 'Courier'
+	max_paragraph = 20000 ## chars, longer paragraphs are drawn in pieces
+	code_batch = 200 ## lines
+
+	def __init__(self, report: PDFREPORT, folder: str, font_size: float = 10):
+		self.report = report
+		self.folder = folder
+		self.font_size = font_size
+		self.paragraph: List[str] = []
+		self.paragraph_size = 0
+		self.item: Tuple[int, str] = None ## indent, bullet
+		self.code: List[str] = None ## lines of the open code block
+		self.table: List[str] = None ## header cells of the open table
+		self.pending_row: str = None ## candidate table header
+
+	## BLOCKS
+
+	def feed(self, line: str) -> None:
+		if self.code is not None:
+			if _md_fence.match(line):
+				self.flush_code()
+				self.code = None
+				self.report.add_space(self.report.spacing)
+			else:
+				self.code.append(line.expandtabs(4))
+				if len(self.code) >= self.code_batch:
+					self.flush_code()
+			return
+
+		if self.pending_row is not None:
+			row, self.pending_row = self.pending_row, None
+			if _md_table_separator.match(line) and '-' in line:
+				self.flush()
+				self.begin_table(_md_cells(row))
+				return
+			self.add_text(row)
+
+		if self.table is not None:
+			if '|' in line:
+				self.table_row(_md_cells(line))
+				return
+			self.table = None
+			self.report.add_space(self.report.spacing)
+
+		stripped = line.strip()
+		if not stripped:
+			self.flush()
+		elif _md_fence.match(line):
+			self.flush()
+			self.code = []
+		elif _md_rule.match(line):
+			self.flush()
+			self.report.add_divider(1)
+		elif stripped.startswith('#') and _md_heading.match(stripped):
+			self.flush()
+			level, text = _md_heading.match(stripped).groups()
+			self.heading(len(level), _md_text(text))
+		elif '|' in stripped and not self.paragraph:
+			self.pending_row = line
+		elif _md_image.match(line):
+			self.flush()
+			alt, path = _md_image.match(line).groups()
+			self.image(alt, path)
+		elif _md_item.match(line):
+			self.flush()
+			spaces, bullet, text = _md_item.match(line).groups()
+			self.item = (len(spaces.expandtabs(4)) // 2, '•' if bullet in '-*+' else bullet)
+			self.add_text(text)
+		elif stripped.startswith('>'):
+			self.add_text(stripped.lstrip('> '))
+		else:
+			self.add_text(stripped)
+
+	def close(self) -> None:
+		if self.code is not None:
+			self.flush_code()
+			self.code = None
+		if self.pending_row is not None:
+			self.add_text(self.pending_row)
+			self.pending_row = None
+		self.flush()
+
+	def add_text(self, text: str) -> None:
+		self.paragraph.append(text.strip())
+		self.paragraph_size += len(text)
+		if self.paragraph_size > self.max_paragraph:
+			self.flush(end=False)
+
+	def flush(self, end: bool = True) -> None:
+		'''
+		Draw the paragraph or list item in memory
+		'''
+		report = self.report
+		if self.paragraph:
+			text = _md_text(' '.join(self.paragraph))
+			self.paragraph, self.paragraph_size = [], 0
+			if self.item:
+				level, bullet = self.item
+				indent = (level + 1) * 14
+				report.ensure(self.font_size + report.spacing)
+				if bullet:
+					bullet_width = GlyphWidths.of(Font.fields.normal.value).width(bullet, self.font_size)
+					report.write(report.marginLeft + indent - 4 - bullet_width, report.cursor_y, bullet, Font.fields.normal, self.font_size)
+				margin = report.marginLeft
+				report.marginLeft = margin + indent
+				try:
+					report.add_paragraph(text, font_size=self.font_size)
+				finally:
+					report.marginLeft = margin
+				self.item = (level, '') if not end else None
+			else:
+				report.add_paragraph(text, font_size=self.font_size)
+			if end:
+				report.add_space(report.spacing)
+		elif end:
+			self.item = None
+
+	def heading(self, level: int, text: str) -> None:
+		report = self.report
+		report.add_space(report.spacing)
+		if level == 1:
+			report.add_header1(text)
+		else:
+			report.add_paragraph(text, Font.fields.bold, max(self.font_size + 4 - level, self.font_size))
+		report.add_space(report.spacing)
+
+	def image(self, alt: str, path: str) -> None:
+		report = self.report
+		if not os.path.isabs(path):
+			path = os.path.join(self.folder, path)
+		if not os.path.isfile(path):
+			if alt:
+				report.add_paragraph(f'[{alt}]', Font.fields.italic, self.font_size)
+			return
+		image = report._image(path)
+		size_percent = min(100.0, 100 * report.get_width() / image.width, 100 * (report.get_y() - report.marginBottom) / image.height)
+		report.add_image(path, size_percent)
+
+	def flush_code(self) -> None:
+		'''
+		Draw the lines of code in memory, in a single text object per page
+		'''
+		report = self.report
+		font_size = self.font_size - 1
+		leading = font_size + report.spacing
+		widths = GlyphWidths.of(self.code_font)
+		max_width = report.get_width()
+		lines = [_cut_text(line, widths, font_size, max_width)[0] if line else '' for line in self.code]
+		self.code = []
+		while lines:
+			count = int((report.cursor_y - report.marginBottom) // leading)
+			if count <= 0:
+				report.showPage()
+				continue
+			_, report.cursor_y = report.write_lines(report.get_x(), report.cursor_y, lines[:count], self.code_font, font_size, colors.HexColor('#333333'))
+			lines = lines[count:]
+
+	## TABLES
+
+	def begin_table(self, headers: List[str]) -> None:
+		self.table = headers
+		self.table_row(headers, header=True)
+
+	def table_row(self, cells: List[str], header: bool = False) -> None:
+		report = self.report
+		font_size = self.font_size - 1
+		row_height = font_size + report.spacing
+		if not header and not report.fits(row_height):
+			report.showPage()
+			self.table_row(self.table, header=True)
+		elif header:
+			report.ensure(2 * row_height)
+		font_name = Font.fields.bold.value if header else Font.fields.normal.value
+		widths = GlyphWidths.of(font_name)
+		col_width = report.get_width() / max(len(self.table), 1)
+		txt = report.PDF.beginText()
+		txt.setFont(font_name, font_size)
+		for i, cell in enumerate(cells[:len(self.table)]):
+			if cell:
+				txt.setTextOrigin(report.get_x() + i * col_width + 3, report.cursor_y)
+				txt.textOut(_cut_text(cell, widths, font_size, col_width - 6)[0])
+		report.PDF.drawText(txt)
+		if header:
+			line_y = report.cursor_y - font_size * 0.3
+			report.PDF.setLineWidth(0.75)
+			report.PDF.line(report.get_x(), line_y, report.get_x() + report.get_width(), line_y)
+		report.cursor_y -= row_height
+
+def _from_markdown(md_path: str, pdf_path: str, docTitle: str = None, font_size: float = 10, **report_args) -> int:
+	'''
 	Create an .pdf document from MarkDown File
+
+	The file is read line by line and every block is drawn as soon as it's complete,
+	so the Markdown text is never held in memory.
+
+	***Note:*** reportlab keeps every finished page (compressed) until `save()`, so memory still grows
+	with the number of pages of the output. Split very large documents and use `render_parallel` if that is a problem.
+
+	Supported: headings, paragraphs, lists, code blocks, tables, images, quotes and horizontal rules.
+	Inline marks (bold, italic, code, links) are written as plain text.
+
+	`Args:`
+		- docTitle: str, file name by default
+		- font_size: float, size of the paragraphs (10)
+		- report_args: pagesize, margins and fonts of `PDFREPORT`
+
+	`Returns:`
+		- int, pages of the document
 	'''
-	pass
+	report = PDFREPORT(pdf_path, docTitle if docTitle else os.path.splitext(os.path.basename(md_path))[0], **report_args)
+	writer = _MarkdownWriter(report, os.path.dirname(os.path.abspath(md_path)), font_size)
+	with open(md_path, encoding='utf-8', errors='replace') as file:
+		for line in file:
+			writer.feed(line.rstrip('\r\n'))
+	writer.close()
+	report.save()
+	return report.page_number
 
 ##OLD METHODS ---------------------------------------------------------------------------------------------------------------
 
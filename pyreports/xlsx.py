@@ -3,19 +3,41 @@ Toolkit with simplified functions and methods for create .xlsx spreadsheets
 '''
 import os
 import re
+import math
+import shutil
 import locale
-from datetime import datetime, timedelta
-from typing import List, Union, Type, Any, Tuple
+import hashlib
+import numbers
+import tempfile
+from bisect import bisect_left
+from copy import copy
+from io import BytesIO
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import islice, accumulate
+from zipfile import ZipFile, ZIP_DEFLATED
+from typing import List, Union, Type, Any, Tuple, Dict, Iterable, Sequence, Iterator, Callable, BinaryIO
 from enum import Enum
 
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles.cell_style import StyleArray
 from openpyxl.styles import Alignment, Font, borders, PatternFill, Protection
 from openpyxl.worksheet import pagebreak
-from openpyxl.utils import get_column_letter, quote_sheetname, absolute_coordinate
+from openpyxl.utils import get_column_letter, column_index_from_string, quote_sheetname, absolute_coordinate
+from openpyxl.utils.datetime import to_excel
 from openpyxl.workbook.defined_name import DefinedName
 from openpyxl.drawing.image import Image
+from openpyxl.writer.excel import ExcelWriter
 
-# from PIL import Image as PILImage
+from . import metrics
+from ._lazy import LazyModule
+
+## Imported on first use
+PILImage = LazyModule('PIL.Image', globals(), 'PILImage')
+np = LazyModule('numpy', globals(), 'np')
+pd = LazyModule('pandas', globals(), 'pd')
 
 
 ## TOOLS
@@ -50,6 +72,7 @@ class alignments(Enum):
     '''
     main = Alignment(horizontal=alignments_horizontal.left.value, vertical=alignments_vertical.center.value)
     top = Alignment(horizontal=alignments_horizontal.left.value, vertical=alignments_vertical.top.value)
+    wrap = Alignment(horizontal=alignments_horizontal.left.value, vertical=alignments_vertical.center.value, wrap_text=True)
 
 class fonts(Enum):
     '''
@@ -67,6 +90,17 @@ class pattern_fills(Enum):
     YELLOW = PatternFill(start_color='E5DE00', end_color='E5DE00', fill_type='solid')
     BLUE = PatternFill(start_color='1A43BF', end_color='1A43BF', fill_type='solid')
 
+## Ids of the normalized formats, which live as long as the module
+_SHARED_STYLES = frozenset(id(member.value) for styles in (fonts, alignments, pattern_fills) for member in styles)
+
+def _style_key(value: Any) -> Any:
+    '''
+    Cache key of a Font, Alignment or PatternFill: its id if it is a normalized format, otherwise its value
+    '''
+    if value is None or id(value) in _SHARED_STYLES:
+        return id(value)
+    return value
+
 
 ## FUNCTIONS
 ## _________________________________________________________________________________________________________________
@@ -77,6 +111,21 @@ def get_os_decimal() -> str:
     '''
     return str(locale.localeconv()['decimal_point'])
 
+def _column_letter(column: int) -> str:
+    string = str()
+    while column > 0:
+        column, remainder = divmod(column - 1, 26)
+        string = chr(65 + remainder) + string
+    return string
+
+def _column_letters() -> Tuple[str, ...]:
+    one = [chr(65 + index) for index in range(26)]
+    two = [first + second for first in one for second in one]
+    return tuple(([''] + one + two + [first + rest for first in one for rest in two])[:16385])
+
+## Lookup table of column letters, from 0 ('') to the last Excel column (16384 -> 'XFD')
+_COLUMN_LETTERS: Tuple[str, ...] = _column_letters()
+
 def get_cell(column: int, row: int = None) -> str:
     '''
     Get Column or cell reference
@@ -90,14 +139,67 @@ def get_cell(column: int, row: int = None) -> str:
         - column = 6 -> 'F'
         - column = 6, row = 7 -> 'F7'
     '''
-    string = str()
-    while column > 0:
-        column, remainder = divmod(column - 1, 26)
-        string = chr(65 + remainder) + string
+    if 0 <= column < len(_COLUMN_LETTERS):
+        string = _COLUMN_LETTERS[column]
+    else:
+        string = _column_letter(column)
     if row:
         string += str(row)
     return string
 
+class FormulaTemplate:
+    '''
+    Formula with "<<>>" markers compiled once against a columns Enum (see `get_formula`)
+
+    The column markers are resolved when the template is created, rendering a row is a single join.
+
+    `Args:`
+        - formula: str
+        - columns_enum: Type[Enum]
+
+    `Example:`
+    ```python
+    template = FormulaTemplate('=IF(<<col2>><<ROW>><0,"Pass","Fail")', my_columns)
+    template.render(5) # '=IF(F5<0,"Pass","Fail")'
+    template.render_rows(2, 100_000) # List of formulas from row 2 to row 100000
+    ```
+    '''
+    _marker = re.compile(r"<<(\w+?)([+-]\d+)?>>")
+
+    def __init__(self, formula: str, columns_enum: Type[Enum]) -> None:
+        self.formula = formula
+        columns = columns_enum.__members__
+
+        def resolve(match: re.Match) -> str:
+            name, offset = match.group(1), match.group(2)
+            if name != 'ROW' and name in columns:
+                return get_cell(columns[name].value + (int(offset) if offset else 0))
+            return match.group(0) ## <<ROW>> and unknown markers
+
+        ## Literal parts between the <<ROW>> markers
+        self._parts: List[str] = self._marker.sub(resolve, formula).split('<<ROW>>')
+
+    def render(self, row: int) -> str:
+        '''
+        Returns the formula of selected row
+        '''
+        if len(self._parts) == 1:
+            return self._parts[0]
+        return str(row).join(self._parts)
+
+    def render_rows(self, row_ini: int, row_fin: int) -> List[str]:
+        '''
+        Returns the formulas from `row_ini` to `row_fin` (both included)
+        '''
+        if len(self._parts) == 1:
+            return [self._parts[0]] * (row_fin - row_ini + 1)
+        parts = self._parts
+        return [str(row).join(parts) for row in range(row_ini, row_fin + 1)]
+
+@lru_cache(maxsize=256)
+def _formula_template(formula: str, columns_enum: Type[Enum]) -> FormulaTemplate:
+    return FormulaTemplate(formula, columns_enum)
+
 def get_formula(formula: str, row: int, columns_enum: Type[Enum]) -> str:
     '''
     Get a formula by replacing the variables into "<<>>" separators with the corresponding reference and row
@@ -128,19 +230,7 @@ def get_formula(formula: str, row: int, columns_enum: Type[Enum]) -> str:
     '=COUNT(<<col1>><<ROW>>:<<col1+9>><<ROW>>)'
     ```
     '''
-    if '<<ROW>>' in formula:
-        formula = formula.replace('<<ROW>>', str(row))
-    for col in columns_enum:
-        placeholder = f"<<{col.name}>>"
-        column_letter = get_cell(col.value)
-        formula = formula.replace(placeholder, column_letter)
-        ## OFFSET
-        Match = re.search(rf"<<{col.name}([+-]\d+)?>>", formula)
-        if Match:
-            offset = int(Match.group(1))
-            column_letter = get_cell(col.value+offset)
-            formula = formula.replace(Match.group(0), column_letter)
-    return formula
+    return _formula_template(formula, columns_enum).render(row)
 
 def get_datetime_from_float(value: float):
     '''
@@ -149,10 +239,215 @@ def get_datetime_from_float(value: float):
     excel_start_date = datetime(1899, 12, 30)  # Nota: Excel comienza en 1899-12-30
     return excel_start_date + timedelta(days=value)
 
+## Average advance of common fonts relative to Calibri, and if they are monospaced (font name in lower case)
+_FONT_WIDTHS: Dict[str, Tuple[float, bool]] = {
+    'calibri': (1.0, False),
+    'calibri light': (0.98, False),
+    'arial': (1.14, False),
+    'helvetica': (1.14, False),
+    'liberation sans': (1.14, False),
+    'arial narrow': (0.93, False),
+    'verdana': (1.32, False),
+    'tahoma': (1.1, False),
+    'segoe ui': (1.08, False),
+    'aptos': (1.05, False),
+    'cambria': (1.05, False),
+    'times new roman': (0.95, False),
+    'consolas': (1.15, True),
+    'courier new': (1.3, True),
+    'lucida console': (1.2, True),
+}
+
+def _char_units(char: str, monospace: bool = False) -> float:
+    '''
+    Approximated advance of a character in Calibri 11 (or any monospaced font), in units of the digit "0" (Excel column width unit)
+    '''
+    if ord(char) >= 0x2E80: ## CJK
+        return 2.0
+    if monospace:
+        return 1.0
+    if char in "ijlI.,:;'!|`":
+        return 0.45
+    if char in 'frt()[]{}-/\\" ':
+        return 0.6
+    if char in 'mwMW@%':
+        return 1.5
+    if char.isupper():
+        return 1.15
+    return 1.0
+
+@lru_cache(maxsize=None)
+def _font_metrics(name: str, size: float, bold: bool) -> Tuple[Dict[str, float], float, bool]:
+    '''
+    Character widths table (printable ASCII), scale and monospace flag of a font, cached per font
+
+    Fonts missing in `_FONT_WIDTHS` are measured as Calibri
+    '''
+    factor, monospace = _FONT_WIDTHS.get(name.lower() if name else '', _FONT_WIDTHS['calibri'])
+    scale = (size if size else 11) / 11 * factor
+    if bold:
+        scale *= 1.07
+    table = {chr(code): _char_units(chr(code), monospace) * scale for code in range(32, 127)}
+    return table, scale, monospace
+
+def get_text_width(text: str, font: Font = fonts.main.value) -> float:
+    '''
+    Returns the column width (Excel units) needed to show a text with selected font
+    '''
+    if '\n' in text:
+        return max(get_text_width(line, font) for line in text.split('\n'))
+    table, scale, monospace = _font_metrics(font.name, font.sz, bool(font.b))
+    units = 0.0
+    for char in text:
+        width = table.get(char)
+        units += width if width is not None else _char_units(char, monospace) * scale
+    return units + 1 if units else 0.0
+
 
 ## XLSX REPORT
 ## _________________________________________________________________________________________________________________
 
+class _RowStream:
+    '''
+    Row buffer of a write-only worksheet
+
+    Only the current row is kept in memory, as `WriteOnlyCell` objects.
+    Writing to a later row flushes it to the worksheet, so rows must be written in ascending order.
+    '''
+    def __init__(self, ws) -> None:
+        self.ws = ws
+        self.row: int = 1
+        self.cells: Dict[int, WriteOnlyCell] = {}
+        self.max_row: int = 0
+        self.max_col: int = 0
+
+    def cell(self, row: int, column: int) -> WriteOnlyCell:
+        '''
+        Returns the pending cell of selected row and column, flushing the previous rows
+        '''
+        if row < self.row:
+            raise ValueError(f"Row {row} of '{self.ws.title}' is already flushed (write-only mode)")
+        while self.row < row:
+            self.flush()
+        cell = self.cells.get(column)
+        if cell is None:
+            cell = self.cells[column] = WriteOnlyCell(self.ws)
+            self.max_row = max(self.max_row, row)
+            self.max_col = max(self.max_col, column)
+        return cell
+
+    def peek(self, row: int, column: int) -> any:
+        '''
+        Returns value of a pending cell (None if empty)
+        '''
+        if row < self.row:
+            raise ValueError(f"Row {row} of '{self.ws.title}' is already flushed (write-only mode)")
+        if row == self.row and column in self.cells:
+            return self.cells[column].value
+        return None
+
+    def flush(self) -> None:
+        '''
+        Append the current row to the worksheet and move to the next one
+        '''
+        values = [None] * max(self.cells, default=0)
+        for column, cell in self.cells.items():
+            values[column - 1] = cell
+        self.ws.append(values)
+        self.cells = {}
+        self.row += 1
+
+    def close(self) -> None:
+        if self.cells:
+            self.flush()
+
+class _ImageMedia:
+    '''
+    Image file stored once in the workbook, whatever the number of sheets/cells where it is placed
+    '''
+    def __init__(self, data: bytes) -> None:
+        with PILImage.open(BytesIO(data)) as img:
+            self.width, self.height = img.size
+            self.format = img.format.lower() if img.format else 'png'
+            if self.format not in ('gif', 'jpeg', 'png'):
+                buf = BytesIO()
+                img.save(buf, format='PNG')
+                data = buf.getvalue()
+                self.format = 'png'
+        self.data = data
+        self.id: int = None ## Assigned by the writer to the first placement, on every save
+
+class _SharedImage(Image):
+    '''
+    Placement of an `_ImageMedia`, every placement of the same media points to the same file in the package
+    '''
+    def __init__(self, media: _ImageMedia, width: float, height: float) -> None:
+        self.ref = None
+        self.media = media
+        self.format = media.format
+        self.width = width
+        self.height = height
+
+    @property
+    def _id(self) -> int:
+        return self.media.id
+
+    @_id.setter
+    def _id(self, value: int) -> None:
+        if self.media.id is None:
+            self.media.id = value
+
+    def _data(self) -> bytes:
+        return self.media.data
+
+class _ExcelWriter(ExcelWriter):
+    '''
+    ExcelWriter that writes each shared image file only once
+    '''
+    def _write_images(self):
+        written = set()
+        for img in self._images:
+            path = img.path
+            if path in written:
+                continue
+            written.add(path)
+            self._archive.writestr(path[1:], img._data())
+
+class _Spans:
+    '''
+    Cumulative sizes (px) of the rows or columns of a sheet, to find spans by bisection
+    '''
+    def __init__(self, default: float, custom: Dict[int, float]) -> None:
+        self.default = default
+        self.indexes = sorted(custom)
+        ## Sum of the differences with the default size, before every custom index
+        self.deltas = list(accumulate((custom[index] - default for index in self.indexes), initial=0.0))
+
+    def offset(self, index: int) -> float:
+        '''
+        Size from the first row/column to `index` (excluded)
+        '''
+        return (index - 1) * self.default + self.deltas[bisect_left(self.indexes, index)]
+
+    def end(self, start: int, size: float) -> int:
+        '''
+        First index after the ones covered by `size` from `start`
+        '''
+        if size <= 0:
+            return start
+        target = self.offset(start) + size
+        step = 1
+        while self.offset(start + step) < target:
+            step *= 2
+        low, high = start + step // 2, start + step ## offset(low) < target <= offset(high)
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.offset(middle) < target:
+                low = middle
+            else:
+                high = middle
+        return high
+
 class XLSREPORT:
     '''
     Sub-Module to make and edit .xlsx Reports
@@ -160,28 +455,52 @@ class XLSREPORT:
     `Args:`
         - `path` (str): Complete or relative path of report file
         - `worksheet_name` (str): Name of current DataSheet
+        - `write_only` (bool): Streaming mode, rows are flushed to the file as they are written (False)
+
+    A new workbook is built in memory and written once on `close()`, an existing file is loaded for edition.
+    It can be used as a context manager:
+    ```python
+    with XLSREPORT('my_report.xlsx', 'Data') as report:
+        report.wr_title(1, 1, 'TITLE')
+    ```
+
+    ***Note:*** In `write_only` mode a new file is always created, rows must be written in ascending order
+    and only the current row can be edited or read. Column widths must be set before the first row is flushed.
     '''
 
-    def __init__(self, path: str, worksheet_name: str = None) -> None: # worksheet_name: str = "Data"
+    def __init__(self, path: str, worksheet_name: str = None, write_only: bool = False) -> None: # worksheet_name: str = "Data"
         self.filePath = path
         extension = os.path.splitext(path)[1]
         if extension == str() or extension == None:
             self.filePath += ".xlsx"
 
-        ## NEW WORKBOOK
+        self.write_only = write_only
+        self._streams: Dict[str, _RowStream] = {}
+        self._styles: Dict[tuple, StyleArray] = {}
+        self._widths: Dict[str, Dict[int, float]] = {}
+        self._media: Dict[str, _ImageMedia] = {}
+        self._media_files: Dict[Tuple[str, float], str] = {}
+        self._spans: Dict[Tuple[str, str], _Spans] = {}
+        self._saved = False
+        self._closed = False
+
+        ## STREAMING WORKBOOK
+        if self.write_only:
+            self.wb = Workbook(write_only=True)
+            self.sheet_new(worksheet_name if worksheet_name else 'Sheet1')
+            self.row: int = 1
+            return
+
+        ## NEW WORKBOOK (in memory, nothing is written until save/close)
         if not os.path.exists(self.filePath):
-            self.wb = Workbook(self.filePath)
-            self.wb.create_sheet(worksheet_name)
-            if worksheet_name:
-                self.ws = self.wb[worksheet_name]
-            else:
-                self.ws = self.wb['Sheet1']
+            self.wb = Workbook()
+            self.ws = self.wb.active
+            self.ws.title = worksheet_name if worksheet_name else 'Sheet1'
             self.ws.sheet_format.defaultRowHeight = 15
-            self.wb.save(self.filePath)
-            self.wb.close()
 
         ## LOAD WORKBOOK
-        self.wb = load_workbook(self.filePath, read_only=False) ## Force load_workbook to open like WriteOnly
+        else:
+            self.wb = load_workbook(self.filePath, read_only=False)
 
         ## WORKSHEET
         if not worksheet_name:
@@ -192,17 +511,54 @@ class XLSREPORT:
             else:
                 self.wb.create_sheet(worksheet_name)
                 self.ws = self.wb[worksheet_name]
-                self.wb.save(self.filePath)
 
         ## INIT
         self.row: int = 1
 
     def save(self) -> None:
-        self.wb.save(self.filePath)
+        ## A write-only workbook can be saved only once
+        if self.write_only and self._saved:
+            return
+        with metrics.timer('xlsx.save', self):
+            if self.write_only:
+                for stream in self._streams.values():
+                    stream.close()
+                self._saved = True
+            if not self._media:
+                self.wb.save(self.filePath)
+            else:
+                ## Shared images
+                if self.write_only and not self.wb.worksheets:
+                    self.wb.create_sheet()
+                for media in self._media.values():
+                    media.id = None
+                ## As `Workbook.save`, the archive is closed even if writing fails
+                self.wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+                with ZipFile(self.filePath, 'w', ZIP_DEFLATED, allowZip64=True) as archive:
+                    _ExcelWriter(self.wb, archive).save()
+        if metrics.enabled:
+            metrics.emit('xlsx.save.bytes', os.path.getsize(self.filePath), report=self)
 
     def close(self) -> None:
-        self.wb.save(self.filePath)
+        '''
+        Save the workbook and close it (only the first call has effect)
+        '''
+        if self._closed:
+            return
+        self.save()
         self.wb.close()
+        self._closed = True
+
+    def __enter__(self) -> 'XLSREPORT':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        ## The file is not written if the report failed
+        if exc_type is None:
+            self.close()
+        else:
+            self.wb.close()
+            self._closed = True
 
     def get_properties(self) -> any:
         return self.wb.properties
@@ -221,8 +577,59 @@ class XLSREPORT:
             self.wb.create_sheet(sheet_name)
         self.ws = self.wb[sheet_name]
         self.ws.sheet_format.defaultRowHeight = 15
+        if self.write_only and not sheet_name in self._streams:
+            self._streams[sheet_name] = _RowStream(self.ws)
         # self.ws.row_dimensions[1:].height = 15
 
+    def _cell(self, row: int, column: int) -> Any:
+        '''
+        Returns the cell object of selected row and column from current sheet
+        '''
+        if self.write_only:
+            return self._streams[self.ws.title].cell(row, column)
+        return self.ws.cell(row, column)
+
+    def _style(self, font: Font, alignment: Alignment, fill: PatternFill = None, number_format: str = None) -> StyleArray:
+        '''
+        Returns the workbook style (font, alignment, fill and number format ids) of selected formatting
+
+        Every combination is registered once per workbook and then shared by reference.
+        `fonts`, `alignments` and `pattern_fills` members are looked up by identity, other objects by value
+        '''
+        key = (_style_key(font), _style_key(alignment), _style_key(fill), number_format)
+        cached = self._styles.get(key)
+        if cached is None:
+            cell = WriteOnlyCell(self.ws)
+            cell.font = font
+            cell.alignment = alignment
+            if fill is not None:
+                cell.fill = fill
+            if number_format is not None:
+                cell.number_format = number_format
+            ## Stored with copies, so editing the caller's objects later can't change the key
+            cached = self._styles[tuple(copy(part) for part in key)] = cell._style
+            if metrics.enabled:
+                metrics.emit('xlsx.styles', 1, report=self)
+        return cached
+
+    @staticmethod
+    def _apply_style(cell: Any, style: StyleArray, fill: bool = False, number_format: bool = False) -> None:
+        '''
+        Set the font and alignment of a style (and its fill and number format if selected) in a cell,
+        the border, protection and any other formatting already in the cell are kept
+        '''
+        if not cell.has_style:
+            cell._style = copy(style)
+            return
+        current = copy(cell._style)
+        current.fontId = style.fontId
+        current.alignmentId = style.alignmentId
+        if fill:
+            current.fillId = style.fillId
+        if number_format:
+            current.numFmtId = style.numFmtId
+        cell._style = current
+
     def row_inc(self, number: int = 1) -> None:
         '''
         Add an increment in row count
@@ -234,32 +641,58 @@ class XLSREPORT:
         Set height of a row
         '''
         self.ws.row_dimensions[row].height = height
+        self._spans.pop((self.ws.title, 'rows'), None)
 
     def col_width(self, column: int, width: float = 20) -> None:
         '''
         Set width of a column
         '''
         self.ws.column_dimensions[get_column_letter(column)].width = width
+        self._spans.pop((self.ws.title, 'columns'), None)
 
-    def col_autofit(self) -> None:
+    def col_fit(self, column: int, value: any, font: Font = fonts.main.value) -> None:
         '''
-        Auto-Adjust the Column Width 
+        Track the width needed by a value in selected column of current sheet (used by `col_autofit`)
         '''
-        for column_cells in self.ws.columns:
-                new_column_length = max(len(str(cell.value)) for cell in column_cells)
-                new_column_letter = (get_column_letter(column_cells[0].column))
-                if new_column_length > 0:
-                    self.ws.column_dimensions[new_column_letter].width = new_column_length*1.23
+        if value is None:
+            return
+        width = get_text_width(value if isinstance(value, str) else str(value), font)
+        widths = self._widths.setdefault(self.ws.title, {})
+        if width > widths.get(column, 0.0):
+            widths[column] = width
+
+    def col_autofit(self, rescan: bool = False) -> None:
+        '''
+        Auto-Adjust the Column Width
+
+        Widths are tracked while the cells are written, so no pass over the sheet is needed.
+        - `rescan:` Measure every cell of the sheet too, for cells that were not written by this report (False)
+
+        ***Note:*** In `write_only` mode it must be called before the first row is flushed
+        '''
+        with metrics.timer('xlsx.col_autofit', self):
+            if rescan and not self.write_only:
+                for column_cells in self.ws.columns:
+                    for cell in column_cells:
+                        self.col_fit(cell.column, cell.value, cell.font)
+            for column, width in self._widths.get(self.ws.title, {}).items():
+                self.ws.column_dimensions[get_column_letter(column)].width = width
+        self._spans.pop((self.ws.title, 'columns'), None)
 
     def col_filters(self) -> None:
         '''
         Set filters in current WorkSheet from A1 to maximun column and maximun row
         '''
-        fullRange = f"A1:{get_column_letter(self.ws.max_column)}{self.ws.max_row}"
+        if self.write_only:
+            stream = self._streams[self.ws.title]
+            max_column, max_row = stream.max_col, stream.max_row
+        else:
+            max_column, max_row = self.ws.max_column, self.ws.max_row
+        fullRange = f"A1:{get_column_letter(max_column)}{max_row}"
         self.ws.auto_filter.ref = fullRange
     
     def cell_protect(self, row: int, column: int) -> None:
-        self.ws.cell(row, column).protection = Protection(locked=True)
+        self._cell(row, column).protection = Protection(locked=True)
 
 
     ## READ/WRITE FUNCTIONS
@@ -269,23 +702,31 @@ class XLSREPORT:
         '''
         Returns value of selected row and column from current sheet
         '''
+        if self.write_only:
+            return self._streams[self.ws.title].peek(row, column)
         return self.ws.cell(row, column).value
 
-    def wr(self, row: int, column: int, value: any = None, font: Font = fonts.main.value, alignment: Alignment = alignments.main.value) -> None:
+    def wr(self, row: int, column: int, value: any = None, font: Font = fonts.main.value, alignment: Alignment = alignments.main.value, fill: PatternFill = None, number_format: str = None, fit: bool = True) -> None:
         '''
         Type the selected cell in specific formatting
-        - `size:` Font Size (10)
-        - `bold:` Font Bold (False)
-        - `font_name:` Font Name ("Arial")
+        - `font:` Font (fonts.main)
+        - `alignment:` Alignment (alignments.main)
+        - `fill:` PatternFill (None), see `pattern_fills`
+        - `number_format:` Number format (None)
+        - `fit:` Track the column width of the value (True), disable it for long texts that may overflow
         '''
+        cell = self._cell(row, column)
+        self._apply_style(cell, self._style(font, alignment, fill, number_format), fill is not None, number_format is not None)
         try:
-            self.ws.cell(row, column).value = value
-            self.ws.cell(row, column).alignment = alignment
-            self.ws.cell(row, column).font = font
+            cell.value = value ## Dates set their own number format
         except Exception as e:
             print("ERROR wr:")
             print(e)
-            self.ws.cell(row, column).value = "ERROR"
+            cell.value = "ERROR"
+        if fit:
+            self.col_fit(column, cell.value, font)
+        if metrics.enabled:
+            metrics.emit('xlsx.cells', 1, report=self)
         # self.row_height(row, 15)
 
     def wr_title(self, row: int, column: int, value: str):
@@ -299,12 +740,8 @@ class XLSREPORT:
         '''
         Write selected cell with Header format
         '''
-        self.wr(row, column, value, font=fonts.header.value, alignment=alignments.main.value)
-        self.ws.cell(row, column).alignment = Alignment(
-            horizontal=alignments_horizontal.left.value,
-            vertical=alignments_vertical.center.value,
-            wrap_text=wrap_text
-        )
+        alignment = alignments.wrap.value if wrap_text else alignments.main.value
+        self.wr(row, column, value, font=fonts.header.value, alignment=alignment)
         # self.row_height(row, 30)
 
     def wr_headers(self, row: int, column_init: int, headers: List[str], wrap_text: bool = False) -> None:
@@ -317,62 +754,107 @@ class XLSREPORT:
             col+=1
         self.row_height(row, 30)
 
+    def wr_rows(self, row: int, column: int, rows: Iterable[Sequence[Any]], font: Font = fonts.main.value, alignment: Alignment = alignments.main.value, fit: bool = True) -> int:
+        '''
+        Write a block of rows from selected cell with the same formatting
+        - `fit:` Track the column widths of every value (True), disable it if widths are tracked with `col_fit`
+
+        Returns:
+
+        - row : int (next available row after the block)
+        '''
+        style = self._style(font, alignment)
+        count = metrics.enabled
+        cells = 0
+        for values in rows:
+            if count:
+                cells += len(values)
+            for col, value in enumerate(values, start=column):
+                cell = self._cell(row, col)
+                self._apply_style(cell, style)
+                try:
+                    cell.value = value ## Dates set their own number format
+                except Exception as e:
+                    print("ERROR wr_rows:")
+                    print(e)
+                    cell.value = "ERROR"
+                if fit:
+                    self.col_fit(col, cell.value, font)
+            row += 1
+        if cells:
+            metrics.emit('xlsx.cells', cells, report=self)
+        return row
+
+    def wr_formulas(self, column: int, row_ini: int, row_fin: int, formula: Union[str, FormulaTemplate], columns_enum: Type[Enum] = None, font: Font = fonts.main.value, alignment: Alignment = alignments.main.value) -> None:
+        '''
+        Fill a column from `row_ini` to `row_fin` with a formula template (see `get_formula`)
+
+        - `formula:` FormulaTemplate, or formula str compiled against `columns_enum`
+
+        ***Note:*** In `write_only` mode each row is flushed when the next one is written,
+        so use `FormulaTemplate.render` while writing the rows instead
+        '''
+        if not isinstance(formula, FormulaTemplate):
+            formula = _formula_template(formula, columns_enum)
+        rows = ((value,) for value in formula.render_rows(row_ini, row_fin))
+        self.wr_rows(row_ini, column, rows, font=font, alignment=alignment, fit=False)
+
     def wr_sci_number(self, row: int, column: int, value: int | float) -> None:
         '''
         Edit selected cell like sci number format (0.0E+0)
         '''
-        self.wr(row, column, value)
-        self.ws.cell(row, column).number_format = '0.0E+0'
+        self.wr(row, column, value, number_format='0.0E+0')
         # self.row_height(row, 15)
 
+    def _image_media(self, img_path: str) -> _ImageMedia:
+        '''
+        Returns the media of an image file, identical files (by content hash) are stored once in the workbook
+        '''
+        key = (os.path.abspath(img_path), os.path.getmtime(img_path))
+        digest = self._media_files.get(key)
+        if digest is None:
+            with metrics.timer('xlsx.image_decode', self):
+                with open(img_path, 'rb') as file:
+                    data = file.read()
+                digest = self._media_files[key] = hashlib.blake2b(data, digest_size=16).hexdigest()
+                if digest not in self._media:
+                    self._media[digest] = _ImageMedia(data)
+        return self._media[digest]
+
+    def _sheet_spans(self, kind: str) -> _Spans:
+        '''
+        Returns the cumulative sizes (px) of the 'rows' or 'columns' of current sheet (cached until a size changes)
+        '''
+        key = (self.ws.title, kind)
+        spans = self._spans.get(key)
+        if spans is None:
+            if kind == 'rows':
+                default = (self.ws.sheet_format.defaultRowHeight or 15) * 96 / 72 ## pt -> px
+                custom = {row: dim.height * 96 / 72 for row, dim in self.ws.row_dimensions.items() if dim.height is not None}
+            else:
+                default = 8.43 * 7 + 5 ## Excel default width -> px
+                custom = {column_index_from_string(letter): dim.width * 7 + 5 for letter, dim in self.ws.column_dimensions.items() if dim.width}
+            spans = self._spans[key] = _Spans(default, custom)
+        return spans
+
     def wr_image(self, row: int, column: int, img_path: str, scale: float = 100.0) -> Tuple[int, int]:
         '''
         Insert an image (*.jpg, *.png) into the selected cell
 
+        The same image placed many times (or in many sheets) is stored only once in the file
+
         Returns:
 
         - row : int (next available row after image)
         - column : int (next available column after image)
         '''
-        image = Image(img_path)
-        image.height = image.height * scale / 100
-        image.width = image.width * scale / 100
+        media = self._image_media(img_path)
+        image = _SharedImage(media, media.width * scale / 100, media.height * scale / 100)
         self.ws.add_image(image, get_cell(column=column, row=row))
 
-        # initial_row = row
-        # initial_col = column
-
-        ## ROWS USED
-        remaining_height = image.height
-        # rows_used = 0
-        while remaining_height > 0:
-            row_dim = self.ws.row_dimensions[row].height
-
-            if row_dim is None:
-                row_dim = 15  # altura por defecto en puntos
-
-            row_px = row_dim * 96 / 72  # pt → px
-
-            remaining_height -= row_px
-            # rows_used += 1
-            row += 1
-        
-        ## COLUMNS USED
-        remaining_width = image.width
-        # cols_used = 0
-        while remaining_width > 0:
-            col_letter = get_column_letter(column)
-            col_width = self.ws.column_dimensions[col_letter].width
-
-            if col_width is None:
-                col_width = 8.43  # valor por defecto de Excel
-
-            col_px = col_width * 7 + 5  # conversión a píxeles
-
-            remaining_width -= col_px
-            # cols_used += 1
-            column += 1
-        
+        ## ROWS / COLUMNS USED
+        row = self._sheet_spans('rows').end(row, image.height)
+        column = self._sheet_spans('columns').end(column, image.width)
         return row, column
 
 
@@ -383,7 +865,7 @@ class XLSREPORT:
     def warp(self, row: int, column: int) -> None:
         '''
         '''
-        self.ws.cell(row, column).alignment = Alignment(wrap_text=True)
+        self._cell(row, column).alignment = Alignment(wrap_text=True)
 
     def set_range_name(self, row: int, column: int, name: str) -> None:
         '''
@@ -410,7 +892,7 @@ class XLSREPORT:
             )
         thin = borders.Border(left = border0, right = border0, bottom = borderLow, top = border0)
         for col in range(col_ini, col_fin): 
-            self.ws.cell(row=row, column=col).border = thin
+            self._cell(row, col).border = thin
 
     def sheet_print_area(self, column_fin: int | str) -> None:
         '''
@@ -423,7 +905,8 @@ class XLSREPORT:
             COL_STR = get_column_letter(column_fin)
         if isinstance(column_fin, str):
             COL_STR = column_fin
-        self.ws.print_area = "A:" + COL_STR
+        ## Whole columns as a cell range, openpyxl can't parse column ranges ("A:C") in any mode
+        self.ws.print_area = f"A1:{COL_STR}1048576"
 
     def sheet_head(self, row_fin: int) -> None:
         '''
@@ -446,30 +929,313 @@ class XLSREPORT:
         self.ws.row_breaks = break_list
 
 
+## TEMPLATES
+## _________________________________________________________________________________________________________________
+## The workbook is saved once: every document copies its compressed parts and writes only the worksheet,
+## made of the literal XML between the variable cells
+
+def _cell_xml(ref: str, style: str, value: Any) -> str:
+    '''
+    XML of a worksheet cell, `style` is its ` s="n"` attribute (or '')
+    '''
+    if value is None:
+        return f'<c r="{ref}"{style}/>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}"{style} t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Number):
+        if isinstance(value, float) and not math.isfinite(value):
+            return f'<c r="{ref}"{style}/>'
+        return f'<c r="{ref}"{style}><v>{value}</v></c>'
+    if isinstance(value, (datetime, date, time, timedelta)):
+        ## The number format of the cell style shows it as a date
+        return f'<c r="{ref}"{style}><v>{to_excel(value)}</v></c>'
+    text = ILLEGAL_CHARACTERS_RE.sub('', str(value)).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    if text.startswith('='):
+        return f'<c r="{ref}"{style}><f>{text[1:]}</f></c>'
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t{space}>{text}</t></is></c>'
+
+class XLSXTemplate:
+    '''
+    Static workbook compiled once and rendered for many documents (mail-merge)
+
+    `build` writes the layout with a `XLSREPORT` (titles, headers, widths, images...) and the styles of the variable cells.
+    A document only writes its values and rows, the rest of the file is copied as it was compiled.
+
+    `Args:`
+        - build: Callable[[XLSREPORT], None]
+        - slots: Dict[str, Tuple[int, int]], cells of the values: name -> (row, column)
+        - table: Tuple[int, int], first cell of the variable rows (None). They take the styles written by `build`
+        in that row, which must be the last one of the worksheet.
+        - worksheet_name: str, worksheet of the slots and the table
+
+    `Example:`
+    ```python
+    def layout(report: XLSREPORT):
+        report.wr_title(1, 1, 'INVOICE')
+        report.wr(3, 1, 'Customer:')
+        report.wr(3, 2, None, font=fonts.header.value) ## style of the slot
+        report.wr_headers(5, 1, ['Item', 'Amount'])
+        report.wr(6, 2, None, number_format='#,##0.00') ## style of the rows
+
+    invoice = XLSXTemplate(layout, {'customer': (3, 2)}, table=(6, 1))
+    for customer, items in invoices:
+        invoice.render(f'{customer}.xlsx', {'customer': customer}, items)
+    ```
+
+    ***Note:*** Dates need a date number format in their cell style. The column widths and the file properties
+    are the ones of the compiled workbook.
+    '''
+
+    def __init__(self, build: Callable[['XLSREPORT'], None], slots: Dict[str, Tuple[int, int]] = None, table: Tuple[int, int] = None, worksheet_name: str = 'Report') -> None:
+        self.slots = dict(slots) if slots else {}
+        self.table = table
+
+        folder = tempfile.mkdtemp(prefix='pyreports_')
+        try:
+            report = XLSREPORT(os.path.join(folder, 'template.xlsx'), worksheet_name)
+            ws = report.ws
+            build(report)
+            for row, column in self.slots.values():
+                if (row, column) not in ws._cells:
+                    report.wr(row, column, fit=False)
+            report.close()
+            with ZipFile(report.filePath) as source:
+                self._sheet_path = ws.path.lstrip('/')
+                sheet = source.read(self._sheet_path).decode('utf-8')
+                ## Every part but the worksheet, compressed once
+                static = BytesIO()
+                with ZipFile(static, 'w', ZIP_DEFLATED) as target:
+                    for info in source.infolist():
+                        if info.filename != self._sheet_path:
+                            target.writestr(info, source.read(info))
+                self._static = static.getvalue()
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+        ## Variable parts of the worksheet: (start, end, kind, data)
+        sheet = re.sub(r'<sheetData\s*/>', '<sheetData></sheetData>', sheet)
+        fields = []
+        self._last_row, self._last_column = 1, 1
+        dimension = re.search(r'<dimension ref="([A-Z]+\d+)(?::([A-Z]+)(\d+))?"\s*/>', sheet)
+        if dimension:
+            first = dimension.group(1)
+            self._last_column = column_index_from_string(dimension.group(2) or re.match(r'[A-Z]+', first).group(0))
+            self._last_row = int(dimension.group(3) or re.search(r'\d+', first).group(0))
+            fields.append((dimension.start(), dimension.end(), 'dimension', first))
+        for name, (row, column) in self.slots.items():
+            cell = re.search(rf'<c r="{get_cell(column, row)}"(?:[^>]*?/>|[^>]*?>.*?</c>)', sheet, re.DOTALL)
+            style = re.search(r'\ss="\d+"', cell.group(0)[:cell.group(0).index('>')])
+            fields.append((cell.start(), cell.end(), 'slot', (name, get_cell(column, row), style.group(0) if style else '')))
+        if table:
+            row, column = table
+            if any(int(number) > row for number in re.findall(r'<row r="(\d+)"', sheet)):
+                raise ValueError(f"The rows of the table ({row}) must be the last ones of the worksheet")
+            self._table_styles: Dict[int, str] = {}
+            self._row_attributes = ''
+            sample = re.search(rf'<row r="{row}"(?:[^>]*?/>|[^>]*?>.*?</row>)', sheet, re.DOTALL)
+            if sample:
+                opening = sample.group(0)[:sample.group(0).index('>')].rstrip('/')
+                self._row_attributes = re.sub(r'\s(?:r|spans)="[^"]*"', '', opening[len('<row'):]).rstrip()
+                for cell in re.finditer(r'<c r="([A-Z]+)\d+"([^>]*?)/?>', sample.group(0)):
+                    style = re.search(r'\ss="\d+"', cell.group(2))
+                    self._table_styles[column_index_from_string(cell.group(1))] = style.group(0) if style else ''
+                fields.append((sample.start(), sample.end(), 'table', None))
+            else:
+                end = sheet.index('</sheetData>')
+                fields.append((end, end, 'table', None))
+
+        ## Literal XML between the variable parts
+        fields.sort(key=lambda field: field[0])
+        self._parts: List[str] = []
+        self._fields: List[Tuple[str, Any]] = []
+        position = 0
+        for start, end, kind, data in fields:
+            self._parts.append(sheet[position:start])
+            self._fields.append((kind, data))
+            position = end
+        self._parts.append(sheet[position:])
+
+    def _table_xml(self, rows: Iterable[Sequence[Any]]) -> Tuple[str, int, int]:
+        '''
+        XML of the variable rows, their last row and their last column
+        '''
+        row, column = self.table
+        styles, attributes = self._table_styles, self._row_attributes
+        xml = []
+        last_row, last_column = 0, 0
+        for last_row, values in enumerate(rows, start=row):
+            cells = [_cell_xml(get_cell(col, last_row), styles.get(col, ''), value) for col, value in enumerate(values, start=column)]
+            last_column = max(last_column, column + len(cells) - 1)
+            xml.append(f'<row r="{last_row}"{attributes}>{"".join(cells)}</row>')
+        return ''.join(xml), last_row, last_column
+
+    def render(self, path: Union[str, BinaryIO], values: Dict[str, Any] = None, rows: Iterable[Sequence[Any]] = ()) -> None:
+        '''
+        Save a document with `values` in the slots and `rows` from the table cell
+
+        - `path:` path or file object
+        '''
+        values = values if values else {}
+        table, last_row, last_column = self._table_xml(rows) if self.table else ('', 0, 0)
+        last_row, last_column = max(self._last_row, last_row), get_cell(max(self._last_column, last_column))
+        xml = [self._parts[0]]
+        for (kind, data), literal in zip(self._fields, self._parts[1:]):
+            if kind == 'slot':
+                name, ref, style = data
+                xml.append(_cell_xml(ref, style, values.get(name)))
+            elif kind == 'table':
+                xml.append(table)
+            else:
+                xml.append(f'<dimension ref="{data}:{last_column}{last_row}"/>')
+            xml.append(literal)
+
+        buffer = BytesIO(self._static)
+        buffer.seek(0, 2)
+        with ZipFile(buffer, 'a', ZIP_DEFLATED) as target:
+            target.writestr(self._sheet_path, ''.join(xml))
+        if isinstance(path, str):
+            with open(path, 'wb') as file:
+                file.write(buffer.getvalue())
+        else:
+            path.write(buffer.getvalue())
+
 
 ## PANDAS
 ## _________________________________________________________________________________________________________________
 
-import pandas as pd
+def df_column_values(series: 'pd.Series') -> list:
+    '''
+    Convert a DataFrame column to a list of native Excel values
 
-def DF_REPORT(path: str, dataFrame: pd.DataFrame) -> None:
+    - datetime64 -> datetime (timezone removed, local time kept)
+    - timedelta64 -> timedelta
+    - NaN / NaT / pd.NA -> None
+    - numpy scalars -> Python scalars
+    '''
+    dtype = series.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        if getattr(dtype, 'tz', None) is not None:
+            series = series.dt.tz_localize(None)
+        return series.to_numpy(dtype='datetime64[us]').astype(object).tolist()
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        return series.to_numpy(dtype='timedelta64[us]').astype(object).tolist()
+    values = series.tolist()
+    mask = series.isna().to_numpy()
+    if mask.any():
+        for i in np.flatnonzero(mask).tolist():
+            values[i] = None
+    if dtype == object:
+        for i, value in enumerate(values):
+            if isinstance(value, np.datetime64):
+                values[i] = value.astype('datetime64[us]').item()
+            elif isinstance(value, np.generic):
+                values[i] = value.item()
+    return values
+
+def df_rows(dataFrame: 'pd.DataFrame', chunk_size: int = 10000) -> Iterator[tuple]:
+    '''
+    Iterate the rows of a DataFrame as tuples of native Excel values
+
+    Columns are converted at once for every chunk of `chunk_size` rows, so memory is bounded by the chunk
+    '''
+    for start in range(0, len(dataFrame.index), chunk_size):
+        chunk = dataFrame.iloc[start:start + chunk_size]
+        columns = [df_column_values(chunk.iloc[:, col]) for col in range(chunk.shape[1])]
+        yield from zip(*columns)
+
+def df_col_fit(report: XLSREPORT, dataFrame: 'pd.DataFrame', column_init: int = 1) -> None:
+    '''
+    Track the column widths of a DataFrame written from `column_init`, measuring only the longest text of every column
+    '''
+    for col in range(dataFrame.shape[1]):
+        series = dataFrame.iloc[:, col].dropna()
+        if pd.api.types.is_datetime64_any_dtype(series.dtype) or pd.api.types.is_timedelta64_dtype(series.dtype):
+            ## Measured as the written values (as `wr` does), pandas drops the time of midnight timestamps
+            texts = pd.Series([str(value) for value in df_column_values(series)], dtype=object)
+        else:
+            texts = series.astype(str)
+        if len(texts):
+            report.col_fit(column_init + col, texts.iloc[int(texts.str.len().to_numpy().argmax())])
+
+def DF_REPORT(path: str, dataFrame: 'pd.DataFrame', write_only: bool = False) -> None:
     '''
     Create excel report from selected Pandas DataFrame
+
+    `Args:`
+        - path: str
+        - dataFrame: pd.DataFrame
+        - write_only: bool, stream the rows to the file with constant memory (False)
     '''
-    report = XLSREPORT(path, worksheet_name='Report')
-    ## HEADERS
-    headers: list = dataFrame.columns.values.tolist()
-    report.wr_headers(1, 1, headers)
-    report.col_filters()
-    report.low_border(report.row, col_fin=len(headers)+1)
-    report.row_inc()
-    ## DATA
-    for row in range(len(dataFrame.index)):
-        row_data = list(dataFrame.iloc[row].values)
-        for value in row_data:
-            report.wr(report.row, row_data.index(value)+1, value)
+    with XLSREPORT(path, worksheet_name='Report', write_only=write_only) as report:
+        headers: list = dataFrame.columns.values.tolist()
+        ## HEADERS
+        report.wr_headers(1, 1, headers)
+        report.col_filters()
+        report.low_border(report.row, col_fin=len(headers)+1)
         report.row_inc()
-    report.col_autofit()
-    ## FIN
-    report.save()
-    report.close()
+        ## COLUMN WIDTHS (longest text of every column, set before the rows are streamed)
+        df_col_fit(report, dataFrame)
+        report.col_autofit()
+        ## DATA
+        report.row = report.wr_rows(report.row, 1, df_rows(dataFrame), fit=False)
+
+def get_datetimes_from_floats(values: Union[Sequence[float], 'np.ndarray', 'pd.Series']) -> 'np.ndarray':
+    '''
+    Returns a datetime64 array from Excel float dates, vectorized version of `get_datetime_from_float`
+
+    NaN / None -> NaT
+    '''
+    days = np.asarray(pd.to_numeric(pd.Series(values), errors='coerce'), dtype='float64')
+    result = np.full(days.shape, np.datetime64('NaT'), dtype='datetime64[us]')
+    mask = ~np.isnan(days)
+    microseconds = np.round(days[mask] * 86_400_000_000).astype('int64')
+    result[mask] = np.datetime64('1899-12-30', 'us') + microseconds.astype('timedelta64[us]')
+    return result
+
+def df_read_chunks(path: str, worksheet_name: str = None, min_row: int = 1, max_row: int = None, min_col: int = 1, max_col: int = None, header: bool = True, date_columns: Sequence[str] = (), chunk_size: int = 10000) -> Iterator['pd.DataFrame']:
+    '''
+    Read a range of an excel sheet as DataFrames of `chunk_size` rows
+
+    The workbook is opened in read-only mode and the values are streamed, so memory is bounded by the chunk.
+    Formulas are read as their last calculated values.
+
+    `Args:`
+        - path: str
+        - worksheet_name: str, first sheet if None
+        - min_row, max_row, min_col, max_col: int, range to read (whole sheet by default)
+        - header: bool, first row of the range has the column names (True), otherwise column letters are used
+        - date_columns: column names with Excel float dates to convert to datetime
+        - chunk_size: int, rows per DataFrame (10000)
+    '''
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[worksheet_name] if worksheet_name else wb[wb.sheetnames[0]]
+        rows = ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+        names: List[str] = None
+        if header:
+            names = [str(value) if value is not None else get_cell(min_col + i) for i, value in enumerate(next(rows, ()))]
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            if names is None:
+                names = [get_cell(min_col + i) for i in range(max(len(values) for values in chunk))]
+            frame = pd.DataFrame.from_records(chunk, columns=names, coerce_float=True)
+            for column in date_columns:
+                if pd.api.types.is_numeric_dtype(frame[column].dtype) or frame[column].dtype == object:
+                    frame[column] = get_datetimes_from_floats(frame[column])
+            yield frame
+    finally:
+        wb.close()
+
+def DF_READ(path: str, worksheet_name: str = None, min_row: int = 1, max_row: int = None, min_col: int = 1, max_col: int = None, header: bool = True, date_columns: Sequence[str] = (), chunk_size: int = 10000) -> 'pd.DataFrame':
+    '''
+    Read a range (or the whole sheet) of an excel file into a Pandas DataFrame
+
+    See `df_read_chunks` for the arguments
+    '''
+    chunks = list(df_read_chunks(path, worksheet_name, min_row, max_row, min_col, max_col, header, date_columns, chunk_size))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True).infer_objects()